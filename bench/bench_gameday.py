@@ -0,0 +1,112 @@
+"""Run a full game-day slate against local stand-in servers and report the cost.
+
+The poster, updater and standings flows run in-process against the fakes in
+bench/fake_servers.py, so nothing touches ESPN, GitHub or Squabblr:
+
+    python bench/bench_gameday.py [--games 16] [--throttle-every 0]
+
+For every flow it prints wall time, requests per host and peak traced
+memory, followed by the process's peak RSS. The fakes serve from threads in
+the same process, so the traced peak includes the payloads they build.
+"""
+import argparse
+import logging
+import os
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path[:0] = [REPO_ROOT, BENCH_DIR]
+
+from fake_servers import SCHEDULES_GIST, STANDINGS_GIST, FakeBackend, ScriptedSlate, configure_env  # noqa: E402
+
+
+class FlowReport:
+    """Measure one flow: wall time, requests per fake host and peak traced memory."""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.rows = []
+
+    def run(self, name, func, *args, **kwargs):
+        before = Counter(self.backend.requests)
+        if hasattr(tracemalloc, 'reset_peak'):  # Python 3.9+
+            tracemalloc.reset_peak()
+        started = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1]
+        requests = Counter(self.backend.requests)
+        requests.subtract(before)
+        self.rows.append((name, elapsed, peak, {host: requests[host] for host in FakeBackend.HOSTS}))
+        return result
+
+    def print(self):
+        hosts = FakeBackend.HOSTS
+        print(f"{'flow':<20}{'wall ms':>10}{'peak KiB':>10}" + ''.join(f"{host:>12}" for host in hosts))
+        totals = Counter()
+        for name, elapsed, peak, requests in self.rows:
+            totals.update(requests)
+            print(f"{name:<20}{elapsed * 1000:>10.1f}{peak / 1024:>10.0f}"
+                  + ''.join(f"{requests[host]:>12}" for host in hosts))
+        wall = sum(row[1] for row in self.rows)
+        print(f"{'total':<20}{wall * 1000:>10.1f}{'':>10}" + ''.join(f"{totals[host]:>12}" for host in hosts))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=16, help="games in the slate, all kicking off together")
+    parser.add_argument('--throttle-every', type=int, default=0,
+                        help="answer every Nth Squabblr request with a 429 (0 disables)")
+    parser.add_argument('--communities', default='NFL', help="NFLBOT_COMMUNITIES, e.g. 'NFL,home0=H0+H1'")
+    parser.add_argument('--max-rounds', type=int, default=20, help="give up if the slate is not final by then")
+    parser.add_argument('--verbose', action='store_true', help="show the bot's own log lines")
+    args = parser.parse_args()
+
+    slate = ScriptedSlate(games=args.games)
+    gists = {
+        SCHEDULES_GIST: {'nfl-schedule.csv': slate.schedule_csv()},
+        STANDINGS_GIST: {'nfl-standings.csv': slate.standings_csv()},
+    }
+    with FakeBackend(slate, gists, throttle_every=args.throttle_every) as backend, \
+            tempfile.TemporaryDirectory() as cache_dir:
+        configure_env(backend, cache_dir, args.communities)
+        logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+
+        from nflbot.commands import post as poster, standings, update as updater
+        report = FlowReport(backend)
+        tracemalloc.start()
+
+        report.run('poster', poster.main, hours=1)
+        slate.advance(1)  # kickoff
+
+        rounds = 0
+        while rounds < args.max_rounds:
+            rounds += 1
+            scoreboard = report.run(f'updater #{rounds}', updater.main)
+            if scoreboard is None:
+                break
+
+        with open(os.devnull, 'w') as devnull:
+            stdout, sys.stdout = sys.stdout, devnull
+            try:
+                report.run('standings', standings.main)
+            finally:
+                sys.stdout = stdout
+        tracemalloc.stop()
+
+        print(f"{args.games} games, {len(backend.posts)} gamethreads posted, "
+              f"{rounds} updater run(s), all final: {slate.all_final}")
+        report.print()
+        # ru_maxrss is KiB on Linux and bytes on macOS
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(f"peak RSS: {maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024):.1f} MiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""Compare cold-start time of the pandas schedule path with nflbot.schedule.
+
+Each variant runs in a fresh interpreter so import cost is included, the
+same way it is on a cold GitHub Actions runner:
+
+    python bench/bench_startup.py [--runs 10]
+"""
+import argparse
+import csv
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PANDAS_SNIPPET = """
+import sys
+import pandas as pd
+df = pd.read_csv(sys.argv[1])
+active = df[df['Status'] == 'STATUS_IN_PROGRESS']
+df.loc[active.index[0], 'Status'] = 'STATUS_FINAL'
+df.to_csv(index=False)
+"""
+
+STORE_SNIPPET = """
+import sys
+from nflbot.schedule import read_schedule
+with open(sys.argv[1]) as f:
+    schedule = read_schedule(f.read())
+active = schedule.with_status('STATUS_IN_PROGRESS')
+active[0]['Status'] = 'STATUS_FINAL'
+schedule.to_csv()
+"""
+
+
+def write_synthetic_schedule(path, games=272):
+    """Write a season-sized schedule CSV with a handful of live games."""
+    start = datetime(2023, 9, 8, 0, 20, tzinfo=timezone.utc)
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow([
+            'Week', 'Date & Time', 'Stadium', 'Home Team', 'Away Team', 'Home Team Short',
+            'Away Team Short', 'Gamecast Link', 'Squabblr Hash ID', 'Status'
+        ])
+        for number in range(games):
+            kickoff = start + timedelta(hours=3 * number)
+            writer.writerow([
+                f"Week {number // 16 + 1}", kickoff.strftime('%Y-%m-%dT%H:%MZ'), f"Stadium {number}",
+                f"Home Team {number % 32}", f"Away Team {(number + 7) % 32}", f"H{number % 32}",
+                f"A{(number + 7) % 32}", f"https://www.espn.com/nfl/game/_/gameId/{401547000 + number}",
+                f"hash{number}" if number < 16 else '',
+                'STATUS_IN_PROGRESS' if number < 16 else 'STATUS_SCHEDULED',
+            ])
+
+
+def time_snippet(snippet, csv_path, runs):
+    timings = []
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    for _ in range(runs):
+        started = datetime.now()
+        subprocess.run([sys.executable, '-c', snippet, csv_path], check=True, env=env)
+        timings.append((datetime.now() - started).total_seconds())
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'nfl-schedule.csv')
+        write_synthetic_schedule(csv_path)
+
+        variants = [('nflbot.schedule', STORE_SNIPPET)]
+        try:
+            import pandas  # noqa: F401
+            variants.append(('pandas', PANDAS_SNIPPET))
+        except ImportError:
+            print("pandas is not installed; timing nflbot.schedule only.")
+
+        results = {}
+        for name, snippet in variants:
+            timings = time_snippet(snippet, csv_path, args.runs)
+            results[name] = statistics.median(timings)
+            print(f"{name:16} median {results[name] * 1000:8.1f} ms  min {min(timings) * 1000:8.1f} ms  ({args.runs} runs)")
+
+        if 'pandas' in results:
+            print(f"speedup: {results['pandas'] / results['nflbot.schedule']:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,524 @@
+"""Local stand-ins for the HTTP services the bot talks to.
+
+Each logical host (ESPN site API, ESPN CDN, GitHub API, raw gist, Squabblr)
+gets its own ThreadingHTTPServer on 127.0.0.1, so per-host request counts
+and connection reuse look the way they do in production. Point the bot at
+them, and at a scratch cache, with configure_env before importing any
+nflbot command:
+
+    with FakeBackend(slate, gists) as backend:
+        configure_env(backend, cache_dir)
+
+A slate supplies the ESPN data: ScriptedSlate generates synthetic games,
+RecordedSlate plays back a scoreboard archive from nflbot.recording.
+"""
+import csv
+import hashlib
+import io
+import json
+import os
+import random
+import threading
+from bisect import bisect_right
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+SCHEDULE_FIELDS = [
+    'Week', 'Date & Time', 'Stadium', 'Home Team', 'Away Team', 'Home Team Short',
+    'Away Team Short', 'Gamecast Link', 'Squabblr Hash ID', 'Status'
+]
+QUARTER_SECONDS = 900
+
+# Gist IDs the fakes serve the schedule and standings under
+SCHEDULES_GIST = 'bench-schedules'
+STANDINGS_GIST = 'bench-standings'
+GAME_SECONDS = 4 * QUARTER_SECONDS
+
+
+def _win_percent(wins, losses, ties):
+    played = wins + losses + ties
+    return f"{(wins + ties / 2) / played:.3f}".lstrip('0') if played else '.000'
+
+
+def _standings_csv(teams, records):
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator='\n')
+    writer.writerow(['Conference', 'Division', 'Team', 'Wins', 'Losses', 'Ties', 'Win %'])
+    for number, team in enumerate(teams):
+        writer.writerow(['AFC' if number % 2 else 'NFC', 'East', team, *records[team], _win_percent(*records[team])])
+    return out.getvalue()
+
+
+def _standings_json(teams, records):
+    """Return standings in the shape of ESPN's CDN standings endpoint."""
+    conferences = []
+    for conference, conference_teams in (('NFC', teams[0::2]), ('AFC', teams[1::2])):
+        divisions = []
+        for start in range(0, len(conference_teams), 4):
+            entries = [{
+                'team': {'displayName': team, 'abbreviation': team[:3]},
+                'stats': [{'name': name, 'displayValue': value} for name, value in
+                          (('wins', str(records[team][0])), ('losses', str(records[team][1])),
+                           ('ties', str(records[team][2])), ('winPercent', _win_percent(*records[team])),
+                           ('pointsFor', '24'), ('pointsAgainst', '17'), ('streak', 'W1'))],
+            } for team in conference_teams[start:start + 4]]
+            divisions.append({'abbreviation': f"{conference} {start // 4}", 'standings': {'entries': entries}})
+        conferences.append({'abbreviation': conference, 'groups': divisions})
+    return {'content': {'standings': {'groups': conferences}}}
+
+
+class ScriptedGame:
+    """One synthetic game whose state is a pure function of elapsed game time."""
+
+    def __init__(self, number, kickoff, seed=0):
+        self.number = number
+        self.game_id = str(401600000 + number)
+        self.kickoff = kickoff
+        self.home = f"Home Team {number}"
+        self.away = f"Away Team {number}"
+        self.home_short = f"H{number}"
+        self.away_short = f"A{number}"
+        self.stadium = f"Stadium {number}"
+        rng = random.Random(seed * 100003 + number)
+        self.home_quarters = [rng.choice((0, 0, 3, 7, 7, 10, 14)) for _ in range(4)]
+        self.away_quarters = [rng.choice((0, 0, 3, 7, 7, 10, 14)) for _ in range(4)]
+        self.elapsed = 0
+
+    @property
+    def gamecast_link(self):
+        return f"https://www.espn.com/nfl/game/_/gameId/{self.game_id}"
+
+    def status(self):
+        if self.elapsed <= 0:
+            return {'clock': 0.0, 'displayClock': '15:00', 'period': 0,
+                    'type': {'name': 'STATUS_SCHEDULED', 'state': 'pre', 'completed': False}}
+        if self.elapsed >= GAME_SECONDS:
+            return {'clock': 0.0, 'displayClock': '0:00', 'period': 4,
+                    'type': {'name': 'STATUS_FINAL', 'state': 'post', 'completed': True}}
+        period = self.elapsed // QUARTER_SECONDS + 1
+        remaining = QUARTER_SECONDS - self.elapsed % QUARTER_SECONDS
+        return {'clock': float(remaining), 'displayClock': f"{remaining // 60}:{remaining % 60:02d}",
+                'period': period, 'type': {'name': 'STATUS_IN_PROGRESS', 'state': 'in', 'completed': False}}
+
+    def _linescores(self, quarters):
+        played = min(self.elapsed // QUARTER_SECONDS + (1 if self.elapsed % QUARTER_SECONDS else 0), 4)
+        return [{'value': float(points)} for points in quarters[:played]]
+
+    def _competitor(self, side, name, short, quarters):
+        linescores = self._linescores(quarters)
+        return {
+            'id': short, 'homeAway': side, 'score': str(int(sum(item['value'] for item in linescores))),
+            'team': {'displayName': name, 'abbreviation': short, 'location': name.rsplit(' ', 1)[0],
+                     'logo': f"https://a.espncdn.com/i/teamlogos/nfl/500/{short}.png",
+                     'color': '002244', 'alternateColor': 'c60c30'},
+            'linescores': linescores,
+            'records': [{'name': 'overall', 'summary': '1-0'}, {'name': 'Home', 'summary': '1-0'}],
+            'leaders': [
+                {'name': stat, 'leaders': [{'displayValue': f"{self.number} YDS, 1 TD",
+                                            'athlete': {'fullName': f"Player {self.number}-{stat}"}}]}
+                for stat in ('passingYards', 'rushingYards', 'receivingYards')
+            ],
+        }
+
+    def _play(self, number):
+        # Real scoreboards list every scoring play with its athletes; this is most of their size
+        return {
+            'type': {'id': str(number), 'text': 'Passing Touchdown', 'abbreviation': 'TD'},
+            'clock': {'value': float(number * 60), 'displayValue': f"{number}:00"},
+            'team': {'id': self.home_short}, 'scoreValue': 7, 'scoringPlay': True,
+            'athletesInvolved': [{
+                'id': f"{self.number}{number}", 'fullName': f"Player {number}", 'jersey': str(number),
+                'headshot': f"https://a.espncdn.com/i/headshots/nfl/players/full/{number}.png",
+                'links': [{'rel': ['playercard', 'desktop', 'athlete'],
+                           'href': f"https://www.espn.com/nfl/player/_/id/{number}/player-{number}"}],
+                'position': 'WR', 'team': {'id': self.home_short},
+            }],
+        }
+
+    def event(self):
+        """Return the game in the shape of an ESPN scoreboard event, filler included."""
+        status = self.status()
+        return {
+            'id': self.game_id,
+            'uid': f"s:20~l:28~e:{self.game_id}",
+            'date': self.kickoff.strftime('%Y-%m-%dT%H:%MZ'),
+            'name': f"{self.away} at {self.home}",
+            'shortName': f"{self.away_short} @ {self.home_short}",
+            'status': status,
+            'competitions': [{
+                'id': self.game_id,
+                'date': self.kickoff.strftime('%Y-%m-%dT%H:%MZ'),
+                'venue': {'fullName': self.stadium, 'address': {'city': 'City', 'state': 'ST'}},
+                'competitors': [
+                    self._competitor('home', self.home, self.home_short, self.home_quarters),
+                    self._competitor('away', self.away, self.away_short, self.away_quarters),
+                ],
+                'status': status,
+                'broadcasts': [{'market': 'national', 'names': ['CBS', 'Paramount+']}],
+                'odds': [{'provider': {'name': 'consensus'}, 'details': f"{self.home_short} -3.5", 'overUnder': 44.5}],
+                'notes': [], 'headlines': [{'description': 'x' * 400, 'type': 'Recap'}],
+                'details': [self._play(number) for number in range(24)],
+            }],
+            'links': [{'href': self.gamecast_link, 'rel': ['summary', 'desktop', 'event']}],
+        }
+
+
+class ScriptedSlate:
+    """A slate of games that all kick off together and advance on every scoreboard fetch."""
+
+    def __init__(self, games=16, kickoff=None, seconds_per_fetch=QUARTER_SECONDS, seed=0):
+        if kickoff is None:
+            kickoff = datetime.now(timezone.utc) + timedelta(minutes=30)
+        self.kickoff = kickoff
+        self.seconds_per_fetch = seconds_per_fetch
+        self.games = [ScriptedGame(number, kickoff, seed) for number in range(games)]
+        self._lock = threading.Lock()
+
+    def advance(self, seconds):
+        with self._lock:
+            for game in self.games:
+                game.elapsed = min(game.elapsed + seconds, GAME_SECONDS)
+
+    @property
+    def all_final(self):
+        return all(game.elapsed >= GAME_SECONDS for game in self.games)
+
+    def scoreboard(self):
+        """Return the current scoreboard, then move every kicked-off game forward."""
+        with self._lock:
+            payload = {
+                'leagues': [{'id': '28', 'abbreviation': 'NFL', 'calendar': [{'label': 'Week 1'}] * 18}],
+                'season': {'type': 2, 'year': self.kickoff.year},
+                'week': {'number': 1},
+                'events': [game.event() for game in self.games],
+            }
+            for game in self.games:
+                if game.elapsed > 0:
+                    game.elapsed = min(game.elapsed + self.seconds_per_fetch, GAME_SECONDS)
+            return payload
+
+    def schedule_csv(self):
+        out = io.StringIO()
+        writer = csv.writer(out, lineterminator='\n')
+        writer.writerow(SCHEDULE_FIELDS)
+        for game in self.games:
+            writer.writerow([
+                'Week 1', game.kickoff.strftime('%Y-%m-%dT%H:%MZ'), game.stadium, game.home, game.away,
+                game.home_short, game.away_short, game.gamecast_link, '', 'STATUS_SCHEDULED'
+            ])
+        return out.getvalue()
+
+    def teams(self):
+        return [team for game in self.games for team in (game.home, game.away)]
+
+    def standings_csv(self):
+        return _standings_csv(self.teams(), self.records())
+
+    def records(self):
+        """Return {team: (wins, losses, ties)}: the slate is Week 1, so only finished games count."""
+        records = {}
+        with self._lock:
+            for game in self.games:
+                home, away = sum(game.home_quarters), sum(game.away_quarters)
+                final = game.elapsed >= GAME_SECONDS
+                for team, scored, allowed in ((game.home, home, away), (game.away, away, home)):
+                    records[team] = (
+                        int(final and scored > allowed), int(final and scored < allowed), int(final and scored == allowed)
+                    )
+        return records
+
+    def standings_json(self):
+        """Return standings in the shape of ESPN's CDN standings endpoint, updated as games finish."""
+        return _standings_json(self.teams(), self.records())
+
+    def schedule_json(self, week):
+        """Return one week in the shape of ESPN's CDN schedule endpoint."""
+        games = [] if str(week) != '1' else [{
+            'id': game.game_id,
+            'week': {'number': 1},
+            'links': [{'href': game.gamecast_link}],
+            'competitions': [{
+                'date': game.kickoff.strftime('%Y-%m-%dT%H:%MZ'),
+                'venue': {'fullName': game.stadium},
+                'competitors': [
+                    {'homeAway': 'home', 'team': {'displayName': game.home, 'abbreviation': game.home_short}},
+                    {'homeAway': 'away', 'team': {'displayName': game.away, 'abbreviation': game.away_short}},
+                ],
+            }],
+        } for game in self.games]
+        return {'content': {'schedule': {self.kickoff.strftime('%Y%m%d'): {'games': games}}}}
+
+
+class RecordedSlate:
+    """Serve recorded scoreboard snapshots, moving between them only when seek() is called.
+
+    The schedule lists every game in the recording as already posted, with
+    the given Squabblr hash IDs, the way the poster leaves it before kickoff.
+    """
+
+    def __init__(self, snapshots):
+        if not snapshots:
+            raise ValueError("The recording has no snapshots.")
+        self.times = [stamp for stamp, _ in snapshots]
+        self.snapshots = [events for _, events in snapshots]
+        self.games = {}
+        for events in self.snapshots:
+            for event in events:
+                self.games.setdefault(event['id'], event)
+        self._index = 0
+        self._lock = threading.Lock()
+
+    @property
+    def start(self):
+        return self.times[0]
+
+    @property
+    def end(self):
+        return self.times[-1]
+
+    def seek(self, stamp):
+        """Serve the last snapshot recorded at or before stamp."""
+        with self._lock:
+            self._index = max(bisect_right(self.times, stamp) - 1, 0)
+
+    def events(self):
+        with self._lock:
+            return self.snapshots[self._index]
+
+    @property
+    def all_final(self):
+        return all(event['status']['type']['state'] == 'post' for event in self.events())
+
+    def scoreboard(self):
+        return {'events': self.events()}
+
+    @staticmethod
+    def _sides(event):
+        return {competitor['homeAway']: competitor for competitor in event['competitions'][0]['competitors']}
+
+    def teams(self):
+        return [
+            side['team']['displayName'] for event in self.games.values()
+            for side in (self._sides(event)['home'], self._sides(event)['away'])
+        ]
+
+    def records(self):
+        """Return {team: (wins, losses, ties)}, counting the games final in the current snapshot."""
+        records = {team: (0, 0, 0) for team in self.teams()}
+        for event in self.events():
+            if event['status']['type']['state'] != 'post':
+                continue
+            sides = self._sides(event)
+            for side, other in (('home', 'away'), ('away', 'home')):
+                scored, allowed = int(sides[side].get('score') or 0), int(sides[other].get('score') or 0)
+                wins, losses, ties = records[sides[side]['team']['displayName']]
+                records[sides[side]['team']['displayName']] = (
+                    wins + (scored > allowed), losses + (scored < allowed), ties + (scored == allowed)
+                )
+        return records
+
+    def schedule_csv(self, hash_ids):
+        out = io.StringIO()
+        writer = csv.writer(out, lineterminator='\n')
+        writer.writerow(SCHEDULE_FIELDS)
+        for game_id, event in self.games.items():
+            sides = self._sides(event)
+            writer.writerow([
+                'Week 1', event.get('date', ''), '', sides['home']['team']['displayName'],
+                sides['away']['team']['displayName'], sides['home']['team'].get('abbreviation', ''),
+                sides['away']['team'].get('abbreviation', ''),
+                f"https://www.espn.com/nfl/game/_/gameId/{game_id}", hash_ids[game_id], 'STATUS_IN_PROGRESS'
+            ])
+        return out.getvalue()
+
+    def standings_csv(self):
+        return _standings_csv(self.teams(), self.records())
+
+    def standings_json(self):
+        return _standings_json(self.teams(), self.records())
+
+    def schedule_json(self, week):
+        return {'content': {'schedule': {}}}
+
+
+class FakeBackend:
+    """Run every stand-in server and keep the gist contents and request counts they share."""
+
+    HOSTS = ('espn-site', 'espn-cdn', 'github-api', 'gist-raw', 'squabblr')
+
+    def __init__(self, slate, gists=None, throttle_every=0):
+        self.slate = slate
+        # gist id -> filename -> content
+        self.gists = {gist_id: dict(files) for gist_id, files in (gists or {}).items()}
+        self.throttle_every = throttle_every
+        self.requests = Counter()
+        self.posts = {}
+        self._lock = threading.Lock()
+        self._servers = {}
+        self._threads = []
+
+    # Server lifecycle
+
+    def start(self):
+        for host in self.HOSTS:
+            server = ThreadingHTTPServer(('127.0.0.1', 0), _handler_for(self, host))
+            server.daemon_threads = True
+            thread = threading.Thread(target=server.serve_forever, name=f"fake-{host}", daemon=True)
+            thread.start()
+            self._servers[host] = server
+            self._threads.append(thread)
+        return self
+
+    def stop(self):
+        for server in self._servers.values():
+            server.shutdown()
+            server.server_close()
+        for thread in self._threads:
+            thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def url(self, host):
+        return f"http://127.0.0.1:{self._servers[host].server_address[1]}"
+
+    def environ(self):
+        """Return the NFLBOT_* base URL overrides that point the bot at these servers."""
+        return {
+            'NFLBOT_ESPN_SITE_API': self.url('espn-site'),
+            'NFLBOT_ESPN_CDN': self.url('espn-cdn'),
+            'NFLBOT_GITHUB_API': self.url('github-api'),
+            'NFLBOT_GIST_RAW': self.url('gist-raw'),
+            'NFLBOT_SQUABBLR_BASE': self.url('squabblr'),
+        }
+
+    # Request handling, one method per host
+
+    def count(self, host, method):
+        with self._lock:
+            self.requests[host] += 1
+            self.requests[f"{host} {method}"] += 1
+            return self.requests[host]
+
+    def handle_espn_site(self, method, url, body):
+        if url.path.endswith('/sports/football/nfl/scoreboard'):
+            return 200, {}, self.slate.scoreboard()
+        return 404, {}, {'error': url.path}
+
+    def handle_espn_cdn(self, method, url, body):
+        if url.path == '/core/nfl/standings':
+            return 200, {}, self.slate.standings_json()
+        if url.path == '/core/nfl/schedule':
+            week = parse_qs(url.query).get('week', ['1'])[0]
+            return 200, {}, self.slate.schedule_json(week)
+        return 404, {}, {'error': url.path}
+
+    def handle_github_api(self, method, url, body):
+        parts = url.path.strip('/').split('/')
+        if len(parts) != 2 or parts[0] != 'gists':
+            return 404, {}, {'message': 'Not Found'}
+        with self._lock:
+            files = self.gists.setdefault(parts[1], {})
+            if method == 'PATCH':
+                for filename, change in json.loads(body)['files'].items():
+                    files[filename] = change['content']
+            return 200, {}, {'id': parts[1], 'files': {
+                filename: {'filename': filename, 'content': content} for filename, content in files.items()
+            }}
+
+    def handle_gist_raw(self, method, url, body, if_none_match=None):
+        parts = url.path.strip('/').split('/')
+        # /<owner>/<gist id>/raw/<filename>
+        if len(parts) != 4 or parts[2] != 'raw':
+            return 404, {}, 'Not Found'
+        with self._lock:
+            content = self.gists.get(parts[1], {}).get(parts[3])
+        if content is None:
+            return 404, {}, 'Not Found'
+        etag = '"%s"' % hashlib.sha1(content.encode('utf-8')).hexdigest()
+        if if_none_match == etag:
+            return 304, {'ETag': etag}, None
+        return 200, {'ETag': etag, 'Content-Type': 'text/plain; charset=utf-8'}, content
+
+    def handle_squabblr(self, method, url, body, count=0):
+        if self.throttle_every and count % self.throttle_every == 0:
+            return 429, {'Retry-After': '0'}, {'message': 'Too Many Requests'}
+        if method == 'POST' and url.path == '/api/new-post':
+            with self._lock:
+                hash_id = f"fake{len(self.posts):05d}"
+                self.posts[hash_id] = parse_qs(body.decode('utf-8')).get('content', [''])[0]
+            return 200, {}, {'hash_id': hash_id}
+        if method == 'PATCH' and url.path.startswith('/api/posts/'):
+            hash_id = url.path.rsplit('/', 1)[-1]
+            with self._lock:
+                if hash_id not in self.posts:
+                    return 404, {}, {'message': 'Post not found'}
+                self.posts[hash_id] = json.loads(body)['content']
+            return 200, {}, {'hash_id': hash_id}
+        return 404, {}, {'message': 'Not Found'}
+
+
+def _handler_for(backend, host):
+    dispatch = getattr(backend, 'handle_' + host.replace('-', '_'))
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def _serve(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            body = self.rfile.read(length) if length else b''
+            count = backend.count(host, self.command)
+            url = urlparse(self.path)
+            if host == 'gist-raw':
+                status, headers, payload = dispatch(self.command, url, body, self.headers.get('If-None-Match'))
+            elif host == 'squabblr':
+                status, headers, payload = dispatch(self.command, url, body, count)
+            else:
+                status, headers, payload = dispatch(self.command, url, body)
+
+            if payload is None:
+                data = b''
+            elif isinstance(payload, str):
+                data = payload.encode('utf-8')
+            else:
+                data = json.dumps(payload).encode('utf-8')
+                headers.setdefault('Content-Type', 'application/json')
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = do_POST = do_PATCH = _serve
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def configure_env(backend, cache_dir, communities='NFL'):
+    """Point nflbot at the backend's servers, with its local store and metrics under cache_dir.
+
+    nflbot reads its configuration at import time, so this has to run before
+    any nflbot command is imported.
+    """
+    os.environ.update(backend.environ())
+    os.environ.update({
+        'SQUABBLES_TOKEN': 'bench-squabblr-token',
+        'NFLBOT_WRITE_TO_GIST': 'bench-github-token',
+        'NFLBOT_SCHEDULES_GIST': SCHEDULES_GIST,
+        'NFLBOT_STANDINGS_GIST': STANDINGS_GIST,
+        'NFLBOT_CACHE_DIR': cache_dir,
+        'NFLBOT_METRICS_DIR': os.path.join(cache_dir, 'metrics'),
+        'NFLBOT_SQUABBLR_RATE': '1000',
+        'NFLBOT_SQUABBLR_BURST': '1000',
+        'NFLBOT_COMMUNITIES': communities,
+    })
@@ -0,0 +1,58 @@
+"""Record the live ESPN scoreboard to an archive that bench/replay_gameday.py can play back.
+
+    python bench/record_scoreboard.py sunday.jsonl.gz [--interval 15] [--hours 14]
+
+Polls the scoreboard every --interval seconds and writes a snapshot each
+time it changed. Recording stops once every game on the scoreboard is
+over, or after --hours. The bot can also record its own fetches by
+setting NFLBOT_RECORD_SCOREBOARD; both write the same format.
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nflbot.espn import parse_scoreboard  # noqa: E402
+from nflbot.http_client import get_session  # noqa: E402
+from nflbot.recording import ScoreboardRecorder  # noqa: E402
+from nflbot.scoreboard import ESPN_SCOREBOARD_URL  # noqa: E402
+
+
+def all_over(content):
+    events = parse_scoreboard(content).get('events', [])
+    return bool(events) and all(event['status']['type']['state'] == 'post' for event in events)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('archive', help="file to append snapshots to, e.g. sunday.jsonl.gz")
+    parser.add_argument('--interval', type=float, default=15, help="seconds between scoreboard fetches")
+    parser.add_argument('--hours', type=float, default=14, help="stop recording after this long")
+    parser.add_argument('--url', default=ESPN_SCOREBOARD_URL, help="scoreboard URL to poll")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    deadline = time.monotonic() + args.hours * 3600
+    with ScoreboardRecorder(args.archive, source=args.url) as recorder:
+        while time.monotonic() < deadline:
+            started = time.monotonic()
+            try:
+                response = get_session().get(args.url)
+                response.raise_for_status()
+            except Exception as e:
+                logging.warning(f"Scoreboard fetch failed, retrying next poll: {e}")
+            else:
+                if recorder.record(response.content):
+                    logging.info(f"Recorded snapshot {recorder.written} ({recorder.skipped} unchanged skipped).")
+                if all_over(response.content):
+                    logging.info("Every game is over; stopping.")
+                    break
+            time.sleep(max(args.interval - (time.monotonic() - started), 0))
+    print(f"{recorder.written} snapshot(s) written to {args.archive}, {recorder.skipped} unchanged skipped.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""Replay a recorded scoreboard archive through the updater, faster than real time.
+
+    python bench/replay_gameday.py sunday.jsonl.gz [--speed 100] [--interval 30]
+
+Every game in the recording starts out posted and in progress, then the
+updater runs once per --interval seconds of recorded time against the
+fakes in bench/fake_servers.py, paced at --speed times real time (0 runs
+back to back). Each run sees the last snapshot recorded before its replay
+time, so overtime, ties and delays come through the way ESPN reported
+them. The report shows how the runs kept up with the replay clock, what
+they published and what the run metrics counted.
+"""
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+sys.path[:0] = [REPO_ROOT, BENCH_DIR]
+# Replays must not append to the archive being replayed
+os.environ.pop('NFLBOT_RECORD_SCOREBOARD', None)
+
+from fake_servers import SCHEDULES_GIST, STANDINGS_GIST, FakeBackend, RecordedSlate, configure_env  # noqa: E402
+from nflbot.recording import read_archive  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('archive', help="archive written by record_scoreboard.py or NFLBOT_RECORD_SCOREBOARD")
+    parser.add_argument('--speed', type=float, default=100, help="replay speed over real time; 0 for no pacing")
+    parser.add_argument('--interval', type=float, default=30, help="recorded seconds between updater runs")
+    parser.add_argument('--communities', default='NFL', help="NFLBOT_COMMUNITIES, e.g. 'NFL,bills=BUF'")
+    parser.add_argument('--verbose', action='store_true', help="show the bot's own log lines")
+    args = parser.parse_args()
+
+    slate = RecordedSlate(read_archive(args.archive))
+    hash_ids = {game_id: f"replay{number:05d}" for number, game_id in enumerate(slate.games)}
+    gists = {
+        SCHEDULES_GIST: {'nfl-schedule.csv': slate.schedule_csv(hash_ids)},
+        STANDINGS_GIST: {'nfl-standings.csv': slate.standings_csv()},
+    }
+    with FakeBackend(slate, gists) as backend, tempfile.TemporaryDirectory() as cache_dir:
+        backend.posts.update({hash_id: '' for hash_id in hash_ids.values()})
+        configure_env(backend, cache_dir, args.communities)
+        logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+        from nflbot.commands import update as updater
+
+        durations, lags, failures = [], [], 0
+        replay_time = slate.start
+        started = time.perf_counter()
+        while True:
+            slate.seek(replay_time)
+            run_started = time.perf_counter()
+            try:
+                # main() returns None once no game is left in progress
+                finished = updater.main() is None
+            except Exception as e:
+                logging.warning(f"Updater run at +{replay_time - slate.start:.0f}s failed: {e}")
+                failures += 1
+                finished = False
+            durations.append(time.perf_counter() - run_started)
+            if finished or replay_time > slate.end + 2 * args.interval:
+                break
+            replay_time += args.interval
+            if args.speed:
+                due = started + (replay_time - slate.start) / args.speed
+                lags.append(max(time.perf_counter() - due, 0))
+                time.sleep(max(due - time.perf_counter(), 0))
+        wall = time.perf_counter() - started
+
+        with open(os.path.join(cache_dir, 'metrics', 'runs.jsonl')) as f:
+            runs = [json.loads(line) for line in f]
+        counters = Counter()
+        for run in runs:
+            counters.update(run['counters'])
+        schedule = backend.gists[SCHEDULES_GIST]['nfl-schedule.csv']
+        finals_marked = schedule.count('STATUS_FINAL')
+        finals_recorded = sum(event['status']['type']['name'] == 'STATUS_FINAL' for event in slate.snapshots[-1])
+
+    recorded = slate.end - slate.start
+    print(f"{len(slate.games)} games, {len(slate.snapshots)} snapshots over {recorded / 60:.0f} recorded minutes")
+    print(f"{len(durations)} updater run(s) in {wall:.1f}s wall ({recorded / wall:.0f}x real time), {failures} failed")
+    print(f"run ms: median {statistics.median(durations) * 1000:.1f}, "
+          f"max {max(durations) * 1000:.1f}, total {sum(durations) * 1000:.0f}")
+    if lags:
+        behind = sum(lag > 0 for lag in lags)
+        print(f"behind the replay clock on {behind} run(s), worst by {max(lags) * 1000:.0f} ms")
+    print(f"gamethread edits: {backend.requests['squabblr PATCH']}, skipped: {counters['edits_skipped']}")
+    print("changes: " + ', '.join(
+        f"{name[len('change_'):]}={value}" for name, value in sorted(counters.items()) if name.startswith('change_')
+    ))
+    print("requests: " + ', '.join(f"{host}={backend.requests[host]}" for host in FakeBackend.HOSTS))
+    print(f"finals marked in the schedule: {finals_marked} of {finals_recorded} recorded")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,7 @@
+"""Same as `python -m nflbot scheduler`; kept so existing cron jobs keep working."""
+import sys
+
+from nflbot.cli import main
+
+if __name__ == '__main__':
+    sys.exit(main(['scheduler', *sys.argv[1:]]))
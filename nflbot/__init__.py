@@ -0,0 +1 @@
+"""Shared helpers for the NFL bot scripts."""
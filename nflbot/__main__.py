@@ -0,0 +1,5 @@
+import sys
+
+from nflbot.cli import main
+
+sys.exit(main())
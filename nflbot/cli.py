@@ -0,0 +1,95 @@
+"""Command-line entry point: `python -m nflbot <command>`.
+
+Each subcommand's module is only imported once that subcommand runs, and
+requests is only imported once something goes over the network, so
+`--help` and an `update` with no game near its live window return without
+loading either.
+"""
+import argparse
+import logging
+import os
+from datetime import datetime, timezone
+
+# How recently the local schedule must have been checked against the gist for
+# `update` to trust it when deciding that nothing is live
+IDLE_MAX_AGE = int(os.environ.get('NFLBOT_IDLE_MAX_AGE', 6 * 3600))
+
+
+def post(args):
+    from nflbot.commands.post import main
+    main(hours=args.hours)
+
+
+def update(args):
+    if not args.force:
+        from nflbot.config import GIST_URL_SCHEDULES
+        from nflbot.scheduler import nothing_live
+        from nflbot.store_reader import cached_schedule
+
+        schedule = cached_schedule(GIST_URL_SCHEDULES, IDLE_MAX_AGE)
+        if schedule is not None and nothing_live(schedule, datetime.now(timezone.utc)):
+            logging.info("No game is in or near its live window; nothing to update.")
+            return
+    from nflbot.commands.update import main
+    main()
+
+
+def standings(args):
+    from nflbot.commands.standings import FORCE_REFRESH, main
+    main(force=args.force or FORCE_REFRESH)
+
+
+def weekly(args):
+    from nflbot.commands.weekly import main
+    main(week=args.week, preview=args.preview)
+
+
+def build_schedule(args):
+    from nflbot.commands.build_schedule import main
+    main()
+
+
+def scheduler(args):
+    from nflbot.commands.scheduler import main
+    main()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='nflbot', description="NFL gamethread bot for Squabblr.")
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+
+    command = commands.add_parser('post', help="post gamethreads for games kicking off soon")
+    command.add_argument('--hours', type=float, default=3, help="post games kicking off within this many hours")
+    command.set_defaults(run=post)
+
+    command = commands.add_parser('update', help="refresh the gamethreads of games in progress")
+    command.add_argument('--force', action='store_true',
+                         help="check the gist even if the local schedule shows nothing live")
+    command.set_defaults(run=update)
+
+    command = commands.add_parser('standings', help="refresh the standings gist after games finish")
+    command.add_argument('--force', action='store_true', help="compare with ESPN even if no game has finished")
+    command.set_defaults(run=standings)
+
+    command = commands.add_parser('weekly', help="post the schedule for the week of the next game")
+    command.add_argument('--week', help="post this week instead, e.g. 'Week 5'")
+    command.add_argument('--preview', action='store_true', help="print the post instead of publishing it")
+    command.set_defaults(run=weekly)
+
+    commands.add_parser('build-schedule', help="merge the season schedule from ESPN into the schedule gist") \
+        .set_defaults(run=build_schedule)
+    commands.add_parser('scheduler', help="stay resident, posting and updating as games come and go") \
+        .set_defaults(run=scheduler)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    try:
+        args.run(args)
+    except KeyboardInterrupt:
+        logging.info(f"nflbot {args.command} stopped.")
+    return 0
+
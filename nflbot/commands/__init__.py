@@ -0,0 +1,5 @@
+"""One module per `nflbot` subcommand, each with a main() that does the work.
+
+Importing a command reads its settings from the environment but makes no
+requests; nflbot.cli imports only the command being run.
+"""
@@ -0,0 +1,41 @@
+"""`nflbot build-schedule`: fetch the season from ESPN and merge it into the schedule gist."""
+import os
+import logging
+
+from nflbot.config import GIST_FILENAME_SCHEDULES as GIST_FILENAME, GIST_ID_SCHEDULES, GITHUB_TOKEN
+from nflbot.gist_journal import GistJournal, fetch_gist_file
+from nflbot.http_client import log_connection_stats
+from nflbot.metrics import instrumented, span
+from nflbot.schedule import read_schedule
+from nflbot.schedule_builder import empty_schedule, fetch_season, merge_schedule
+
+GIST_ID = GIST_ID_SCHEDULES or "ef63fd2037741d41c2209b46da0779b8"
+SEASON = int(os.environ.get('NFLBOT_SEASON', 2023))
+SEASON_WEEKS = int(os.environ.get('NFLBOT_SEASON_WEEKS', 18))
+FETCH_WORKERS = int(os.environ.get('NFLBOT_SCHEDULE_WORKERS', 6))
+
+@instrumented('schedule-creation-bot')
+def main():
+    # Start from the live gist so hash IDs and statuses already written survive the refresh
+    with span('load'):
+        existing = fetch_gist_file(GIST_ID, GIST_FILENAME, GITHUB_TOKEN)
+        schedule = read_schedule(existing) if existing else empty_schedule()
+    logging.info(f"Loaded {len(schedule)} existing games from the gist.")
+
+    # Fetching schedule for every week of the season
+    with span('fetch'):
+        games = fetch_season(SEASON, range(1, SEASON_WEEKS + 1), workers=FETCH_WORKERS)
+    logging.info(f"Fetched {len(games)} games for weeks 1-{SEASON_WEEKS} of {SEASON}.")
+
+    with span('render'):
+        changed, added = merge_schedule(schedule, games)
+    journal = GistJournal(GITHUB_TOKEN)
+    journal.track(GIST_ID, GIST_FILENAME, schedule.to_csv)
+    if changed or added:
+        journal.record(GIST_ID, GIST_FILENAME, f"{changed} game(s) changed, {added} game(s) added")
+
+    # Updating the gist with the merged schedule; nothing is written when nothing changed
+    with span('persist'):
+        journal.flush()
+    log_connection_stats()
+    print("Gist updated successfully!" if changed or added else "Schedule already up to date.")
@@ -0,0 +1,103 @@
+"""`nflbot post`: post gamethreads for games kicking off soon."""
+import logging
+from datetime import datetime, timedelta
+from functools import partial
+import pytz
+
+from nflbot.config import (
+    GIST_FILENAME_SCHEDULES, GIST_ID_SCHEDULES, GIST_URL_SCHEDULES, GIST_URL_STANDINGS, GITHUB_TOKEN,
+)
+from nflbot.fanout import (
+    COMMUNITIES, COMMUNITY_HASHES_FIELD, PRIMARY_COMMUNITY, FanoutPublisher, communities_for, read_hash_ids,
+    write_hash_ids,
+)
+from nflbot.gist_journal import GistJournal
+from nflbot.http_client import log_connection_stats
+from nflbot.local_store import get_store
+from nflbot.metrics import instrumented, span
+from nflbot.squabblr import post_to_squabblr
+from nflbot.templates import get_template
+
+# 1. Function Definitions
+
+def filter_upcoming_games(schedule, hours=3):
+    utc = pytz.utc
+    now = datetime.now(utc)  # Make this timezone-aware in UTC
+    end_time = now + timedelta(hours=hours)
+    
+    return schedule.kickoff_between(now, end_time, 'STATUS_SCHEDULED')
+
+def missing_communities(game):
+    hash_ids = read_hash_ids(game)
+    return [community for community in communities_for(game) if community not in hash_ids]
+
+def games_to_post(schedule, hours=3):
+    """Return the upcoming games, then any posted game still missing its thread in another community."""
+    games = filter_upcoming_games(schedule, hours)
+    if len(COMMUNITIES) > 1:
+        games += [game for game in schedule.with_status('STATUS_IN_PROGRESS') if missing_communities(game)]
+    return games
+
+def construct_post_content(row, standings):
+    template = get_template(row, standings)
+    scoreboard_section = template.render_scoreboard(f"Waiting for Kickoff []({template.gamecast_link})")
+    return template.title, template.render(scoreboard_section)
+
+# 2. Main Logic
+
+@instrumented('gamethread-poster')
+def main(hours=3, schedule=None):
+    # Load the CSV data from uploaded files
+    with span('load'):
+        if schedule is None:
+            schedule = get_store().pull_schedule(GIST_URL_SCHEDULES)
+        standings = get_store().pull_standings(GIST_URL_STANDINGS)
+    logging.info("Data loaded successfully.")
+
+    store = get_store()
+    journal = GistJournal(GITHUB_TOKEN)
+    if len(COMMUNITIES) > 1:
+        schedule.ensure_columns([COMMUNITY_HASHES_FIELD])
+
+    publisher = FanoutPublisher()
+    failures = 0
+    try:
+        for game in games_to_post(schedule, hours):
+            # Rendered once, however many communities get the thread
+            with span('render'):
+                title, content = construct_post_content(game, standings)
+            
+            # Post to every community that does not have the thread yet and collect the hash_ids
+            hash_ids = read_hash_ids(game)
+            with span('publish'):
+                results, errors = publisher.publish({
+                    community: partial(post_to_squabblr, title, content, community)
+                    for community in missing_communities(game)
+                })
+            failures += len(errors)
+            if not results:
+                continue
+            hash_ids.update({community: response_data['hash_id'] for community, response_data in results.items()})
+            
+            # Update the CSV; the game is live once the primary community has its thread, and
+            # the next run retries any other community that failed
+            write_hash_ids(game, hash_ids)
+            if PRIMARY_COMMUNITY in hash_ids:
+                game['Status'] = 'STATUS_IN_PROGRESS'
+            store.save_game(game)
+            posted = ', '.join(f"{results[community]['hash_id']} in /s/{community}" for community in results)
+            journal.record(GIST_ID_SCHEDULES, GIST_FILENAME_SCHEDULES, f"posted {title} as {posted}")
+            logging.info(f"Updated schedule CSV for game: {title}.")
+    finally:
+        publisher.close()
+        # Save the hash IDs of everything that was posted, even if a later post failed
+        with span('persist'):
+            synced = store.stage_schedule(journal, GIST_ID_SCHEDULES, GIST_FILENAME_SCHEDULES, GITHUB_TOKEN)
+            journal.flush()
+            store.mark_synced(synced)
+    log_connection_stats()
+
+    if failures:
+        raise RuntimeError(f"{failures} gamethread post(s) failed; the next run retries them.")
+
+    logging.info("Script completed successfully.")
@@ -0,0 +1,68 @@
+"""`nflbot scheduler`: stay resident, posting and updating gamethreads as games come and go."""
+import os
+import time
+import logging
+from datetime import datetime
+
+import pytz
+
+from nflbot.commands import post as poster, update as updater
+from nflbot.config import GIST_URL_SCHEDULES
+from nflbot.local_store import get_store
+from nflbot.scheduler import IDLE_POLL, NORMAL_POLL, live_poll_delay, seconds_until
+
+# Constants
+# How long before kickoff the gamethread is posted
+POST_LEAD_MINUTES = int(os.environ.get('NFLBOT_POST_LEAD_MINUTES', 60))
+# How often the schedule is re-read from the gist to pick up outside edits
+SCHEDULE_RELOAD_SECONDS = int(os.environ.get('NFLBOT_SCHEDULE_RELOAD_SECONDS', 3600))
+
+def load_schedule():
+    return get_store().pull_schedule(GIST_URL_SCHEDULES)
+
+def run_once(schedule):
+    """Do whatever is due right now and return how long to sleep before the next pass."""
+    now = datetime.now(pytz.utc)
+    lead_seconds = POST_LEAD_MINUTES * 60
+
+    until_window = seconds_until(schedule.next_game_after(now, 'STATUS_SCHEDULED'), now, lead_seconds)
+    if until_window == 0:
+        logging.info("A kickoff is inside the posting window; running the gamethread poster...")
+        poster.main(hours=POST_LEAD_MINUTES / 60, schedule=schedule)
+        until_window = seconds_until(schedule.next_game_after(now, 'STATUS_SCHEDULED'), now, lead_seconds)
+
+    delays = [IDLE_POLL]
+    if until_window is not None:
+        delays.append(until_window)
+
+    scoreboard = updater.main(schedule=schedule)
+    if scoreboard is not None:
+        live_delay = live_poll_delay(scoreboard.events())
+        if live_delay is not None:
+            delays.append(live_delay)
+        else:
+            # Threads are up but nothing has kicked off yet; wake at the earliest kickoff
+            pending = seconds_until(schedule.next_game_after(now, 'STATUS_IN_PROGRESS'), now)
+            delays.append(pending if pending is not None else NORMAL_POLL)
+
+    return max(min(delays), 1)
+
+def main():
+    logging.info("Starting gamethread scheduler...")
+
+    # The scheduler's copy of the schedule is authoritative between reloads: the raw
+    # gist URL is CDN-cached, so re-reading it right after our own writes could
+    # show a just-posted game as still scheduled.
+    schedule = None
+    loaded_at = 0
+    while True:
+        try:
+            if schedule is None or time.monotonic() - loaded_at > SCHEDULE_RELOAD_SECONDS:
+                schedule = load_schedule()
+                loaded_at = time.monotonic()
+            delay = run_once(schedule)
+        except Exception:
+            logging.exception("Scheduler pass failed; retrying shortly.")
+            delay = 60
+        logging.info(f"Next scheduler pass in {int(delay)} seconds.")
+        time.sleep(delay)
@@ -0,0 +1,32 @@
+"""`nflbot standings`: refresh the standings gist if a finished game could have changed it."""
+import requests
+import os
+
+from nflbot.config import GIST_ID_STANDINGS, GIST_URL_SCHEDULES, GITHUB_TOKEN
+from nflbot.gist_journal import GistJournal
+from nflbot.http_client import log_connection_stats
+from nflbot.local_store import get_store
+from nflbot.metrics import get_metrics, instrumented, span
+from nflbot.standings_sync import sync_standings
+
+# Set to 1 to fetch and compare ESPN's standings even if no game has finished
+FORCE_REFRESH = os.environ.get('NFLBOT_STANDINGS_FORCE', '0') == '1'
+
+@instrumented('standings-updater')
+def main(force=FORCE_REFRESH):
+    try:
+        with span('load'):
+            schedule = get_store().pull_schedule(GIST_URL_SCHEDULES)
+        journal = GistJournal(GITHUB_TOKEN)
+        with span('fetch'):
+            changed = sync_standings(journal, GIST_ID_STANDINGS, GITHUB_TOKEN, schedule, force=force)
+        with span('persist'):
+            journal.flush()
+        if changed:
+            print("The Gist has been updated successfully.")
+        else:
+            print("The standings are already up to date.")
+        log_connection_stats()
+    except requests.RequestException as e:
+        print(f"An error occurred: {e}")
+        get_metrics().finish('failed')
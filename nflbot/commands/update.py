@@ -0,0 +1,230 @@
+"""`nflbot update`: refresh the gamethreads of games in progress."""
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from functools import partial
+import pytz
+import logging
+
+from nflbot.concurrency import SQUABBLR_HOST, HostLimiter
+from nflbot.config import (
+    GIST_FILENAME_SCHEDULES, GIST_ID_SCHEDULES, GIST_ID_STANDINGS, GIST_URL_SCHEDULES, GIST_URL_STANDINGS,
+    GITHUB_TOKEN,
+)
+from nflbot.digests import DIGESTS_FILENAME, DigestStore, scoreboard_digest
+from nflbot.fanout import COMMUNITIES, FanoutPublisher, read_hash_ids
+from nflbot.game_state import STATES_FILENAME, GameStateStore, game_state_from_event, should_publish
+from nflbot.gist_journal import GistJournal, fetch_gist_files
+from nflbot.http_client import log_connection_stats
+from nflbot.local_store import get_store
+from nflbot.metrics import get_metrics, instrumented, span
+from nflbot.scoreboard import ScoreboardSnapshot, game_id_from_link
+from nflbot.squabblr import update_gamethread_on_squabblr
+from nflbot.standings_sync import game_result, sync_standings
+from nflbot.templates import format_eastern_time, get_template, ordinal
+
+# Constants
+# Number of games refreshed at once; 0 means one worker per active game, 1 runs sequentially
+UPDATER_WORKERS = int(os.environ.get('NFLBOT_UPDATER_WORKERS', 0))
+
+def fetch_active_games(schedule):
+    return schedule.with_status('STATUS_IN_PROGRESS')
+
+def fetch_game_data_from_espn(gamecast_link, scoreboard):
+    return scoreboard.get_event(game_id_from_link(gamecast_link))
+
+def construct_post_content(game, standings, event_data):
+    home_linescores = {}
+    away_linescores = {}
+    
+    # Fetch home and away teams from the API response
+    for competitor in event_data['competitions'][0]['competitors']:
+        if competitor['homeAway'] == 'home':
+            home_team_api = competitor['team']['displayName']
+            home_score = competitor['score']
+            for index, item in enumerate(competitor['linescores']):
+                home_linescores[index + 1] = int(item['value'])
+        else:
+            away_score = competitor['score']
+            for index, item in enumerate(competitor['linescores']):
+                away_linescores[index + 1] = int(item['value'])
+
+    # Match API's home and away teams with game's teams
+    template = get_template(game, standings, swapped=game['Home Team'] != home_team_api)
+
+    # Extract game time from the ESPN API
+    game_status = event_data['competitions'][0]['status']['type']['name']
+    if game_status == "STATUS_FINAL":
+        game_time = "Final"
+    else:
+        period = event_data['competitions'][0]['status']['period']
+        display_clock = event_data['competitions'][0]['status']['displayClock']
+        game_time = f"{display_clock} left in the {ordinal(period)} Quarter."
+
+    current_time = format_eastern_time(datetime.now(pytz.utc))
+
+    # Everything that changes during a game lives in the scoreboard section
+    scoreboard_section = template.render_scoreboard(game_time, home_linescores, away_linescores, home_score, away_score)
+    return template.render(scoreboard_section, updated_at=current_time), scoreboard_section
+
+def publish_update(content, hash_id, limiter):
+    with limiter.slot(SQUABBLR_HOST):
+        return update_gamethread_on_squabblr(content, hash_id)
+
+def update_game(game, standings, scoreboard, limiter, digests, states, publisher):
+    """Refresh one gamethread and return the game's ESPN status, or None if ESPN has no data."""
+    logging.info(f"Fetching game data for {game['Away Team']} vs. {game['Home Team']} from ESPN...")
+    game_id = game_id_from_link(game['Gamecast Link'])
+    event_data = fetch_game_data_from_espn(game['Gamecast Link'], scoreboard)
+
+    if not event_data:
+        logging.warning(f"Failed to fetch game data for {game['Away Team']} vs. {game['Home Team']} from ESPN.")
+        return None
+
+    # Compare against the state last published so a stalled clock is not re-rendered; a thread that has
+    # never been edited, like one a community got late, is still brought up to date
+    state = game_state_from_event(event_data)
+    changes = states.compare(game_id, state)
+    for change in changes:
+        get_metrics().count(f"change_{change.kind}")
+    hash_ids = read_hash_ids(game)
+    changed = should_publish(changes)
+    if not changed:
+        hash_ids = {community: hash_id for community, hash_id in hash_ids.items() if hash_id not in digests}
+    if not hash_ids:
+        detail = f"only {', '.join(change.kind for change in changes)} changed" if changes else "nothing changed"
+        logging.info(f"Since the last edit {detail}; skipping gamethread for game: {game['Away Team']} vs {game['Home Team']}")
+        return state.status
+
+    # Rendered once and sent to the thread in every community
+    with span('render'):
+        content, scoreboard_section = construct_post_content(game, standings, event_data)
+
+    digest = scoreboard_digest(scoreboard_section)
+    pending = {community: hash_id for community, hash_id in hash_ids.items() if not digests.is_unchanged(hash_id, digest)}
+    if not pending:
+        logging.info(f"Scoreboard unchanged, skipping gamethread edit for game: {game['Away Team']} vs {game['Home Team']}")
+        states.record(game_id, state)
+        return state.status
+
+    logging.info(f"Updating {len(pending)} gamethread(s) for game: {game['Away Team']} vs {game['Home Team']}")
+    with span('publish'):
+        results, errors = publisher.publish({
+            community: partial(publish_update, content, hash_id, limiter) for community, hash_id in pending.items()
+        })
+    for community in results:
+        digests.record(pending[community], digest)
+    if errors:
+        raise next(iter(errors.values()))
+    if changed:
+        states.record(game_id, state)
+    logging.info(f"Successfully updated gamethread for game: {game['Away Team']} vs {game['Home Team']}")
+
+    return state.status
+
+@instrumented('gamethread-updater')
+def main(schedule=None):
+    logging.info("Starting gamethread updater...")
+
+    # Load the CSV data
+    logging.info("Loading schedule and standings data...")
+    store = get_store()
+    with span('load'):
+        if schedule is None:
+            schedule = store.pull_schedule(GIST_URL_SCHEDULES)
+        standings = store.pull_standings(GIST_URL_STANDINGS)
+    logging.info("Data loaded successfully.")
+    logging.info("Checking for games in progress...")
+
+    active_games = fetch_active_games(schedule)
+    # Check if there are no active games and log a message
+    if not active_games:
+        logging.info("No games are in progress.")
+        logging.info("Gamethread updater finished.")
+        return None
+
+    # Fetch the scoreboard up front so the workers only read from the snapshot
+    scoreboard = ScoreboardSnapshot()
+    with span('fetch'):
+        scoreboard.refresh()
+    limiter = HostLimiter()
+    # Digests and game states live in the schedules gist and only the updater writes them, so this early read is enough
+    with span('load'):
+        gist_files = fetch_gist_files(GIST_ID_SCHEDULES, GITHUB_TOKEN)
+        digests = DigestStore.from_content(gist_files.get(DIGESTS_FILENAME))
+        states = GameStateStore.from_content(gist_files.get(STATES_FILENAME))
+
+    workers = UPDATER_WORKERS or len(active_games)
+    logging.info(f"Updating {len(active_games)} gamethread(s) with {workers} worker(s)...")
+
+    final_games = []
+    failures = 0
+    # Every game worker can be waiting on a post in every community at once
+    with ThreadPoolExecutor(max_workers=workers) as executor, \
+            FanoutPublisher(workers * len(COMMUNITIES)) as publisher:
+        futures = {
+            executor.submit(update_game, game, standings, scoreboard, limiter, digests, states, publisher): game
+            for game in active_games
+        }
+        for future in as_completed(futures):
+            game = futures[future]
+            try:
+                status = future.result()
+            except Exception:
+                logging.exception(f"Failed to update gamethread for game: {game['Away Team']} vs {game['Home Team']}")
+                failures += 1
+                continue
+            if status == 'STATUS_FINAL':
+                final_games.append(game)
+
+    journal = GistJournal(GITHUB_TOKEN)
+
+    # Update the CSV for every game whose status has changed to "STATUS_FINAL"
+    for game in final_games:
+        logging.info(f"Updating game status to 'STATUS_FINAL' for {game['Away Team']} vs. {game['Home Team']} in the CSV...")
+        game['Status'] = 'STATUS_FINAL'
+        store.save_game(game)
+        journal.record(GIST_ID_SCHEDULES, GIST_FILENAME_SCHEDULES, f"{game['Away Team']} vs. {game['Home Team']} is final")
+
+    # Forget games that are no longer in progress and save what was published
+    still_active = [game for game in active_games if game not in final_games]
+    digests.prune(hash_id for game in active_games for hash_id in read_hash_ids(game).values())
+    states.prune(game_id_from_link(game['Gamecast Link']) for game in still_active)
+    if digests.dirty:
+        journal.write(GIST_ID_SCHEDULES, DIGESTS_FILENAME, digests.dumps())
+    if states.dirty:
+        journal.write(GIST_ID_SCHEDULES, STATES_FILENAME, states.dumps())
+    logging.info(f"Skipped {digests.skipped} unchanged gamethread edit(s).")
+    get_metrics().count('edits_skipped', digests.skipped)
+
+    # The schedule is read from the gist again here, since the poster may have posted a game while the workers
+    # ran. Status changes, digests and game states then go out in one PATCH to the schedules gist.
+    with span('persist'):
+        synced = store.stage_schedule(journal, GIST_ID_SCHEDULES, GIST_FILENAME_SCHEDULES, GITHUB_TOKEN)
+        journal.flush()
+        store.mark_synced(synced)
+
+    # Apply the final scores to the standings once the schedule is safe; nothing that goes wrong here may
+    # fail the run, since the hourly standings run reconciles with ESPN and picks up any final missed
+    if final_games:
+        try:
+            results = [
+                game_result(game_id_from_link(game['Gamecast Link']), fetch_game_data_from_espn(game['Gamecast Link'], scoreboard))
+                for game in final_games
+            ]
+            standings_journal = GistJournal(GITHUB_TOKEN)
+            with span('fetch'):
+                sync_standings(standings_journal, GIST_ID_STANDINGS, GITHUB_TOKEN, schedule, results)
+            with span('persist'):
+                standings_journal.flush()
+        except Exception:
+            logging.exception("Could not refresh the standings after the final(s); the standings run will retry.")
+
+    scoreboard.log_summary()
+    log_connection_stats()
+
+    if failures:
+        raise RuntimeError(f"{failures} gamethread update(s) failed.")
+
+    logging.info("Gamethread updater finished.")
+    return scoreboard
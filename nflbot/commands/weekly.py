@@ -0,0 +1,89 @@
+"""`nflbot weekly`: post the schedule for the week of the next game."""
+import logging
+from datetime import datetime
+from functools import partial
+import pytz
+
+from nflbot.config import GIST_URL_SCHEDULES, GIST_URL_STANDINGS
+from nflbot.fanout import COMMUNITIES, FanoutPublisher, communities_for
+from nflbot.http_client import log_connection_stats
+from nflbot.local_store import get_store
+from nflbot.metrics import instrumented, span
+from nflbot.squabblr import post_to_squabblr
+from nflbot.week_tables import build_week_table, week_table
+
+def find_next_game_week(schedule):
+    """Find the week of the next scheduled game."""
+    utc = pytz.utc
+    now = datetime.now(utc)  # Make this timezone-aware in UTC
+    
+    next_game = schedule.next_game_after(now)
+    return next_game['Week']
+
+def construct_post_content(week, table_content):
+    content_lines = [
+        f"#### Here's what's on tap for {week} in the NFL 2023 Season!",
+        "",
+        table_content,
+        "",
+        "##### [Join us in the live chat for every game!](https://squabblr.co/s/nfl/chat)",
+        "",
+        "----",
+        "",
+        "I am a bot. Post your feedback on /s/ModBot"
+    ]
+    return "\n".join(content_lines)
+
+def community_tables(week, schedule, standings, table):
+    """Return {community: table}, with team communities only getting their teams' games."""
+    tables = {}
+    for position, community in enumerate(COMMUNITIES):
+        if position == 0 or not community.teams:
+            tables[community.name] = table
+            continue
+        games = [game for game in schedule if game['Week'] == week and community.name in communities_for(game)]
+        if games:
+            tables[community.name] = build_week_table(games, standings)
+        else:
+            logging.info(f"No games for /s/{community.name} in {week}; not posting there.")
+    return tables
+
+@instrumented('weekly-schedule-poster')
+def main(week=None, preview=False):
+    # Load the CSV data
+    store = get_store()
+    with span('load'):
+        schedule = store.pull_schedule(GIST_URL_SCHEDULES)
+        standings = store.pull_standings(GIST_URL_STANDINGS)
+    logging.info("Data loaded successfully.")
+
+    # Post the week of the next game unless another week was asked for
+    next_week = week or find_next_game_week(schedule)
+
+    # Construct the post content; the table is reused while neither gist has changed
+    title = f"{next_week} Schedule - NFL 2023 Season"
+    versions = (store.version(GIST_URL_SCHEDULES), store.version(GIST_URL_STANDINGS))
+    with span('render'):
+        try:
+            table = week_table(next_week, schedule, standings, store, versions)
+        except ValueError as e:
+            # Most likely a mistyped --week; nothing is posted
+            raise SystemExit(f"{e}; nothing was posted.")
+        tables = community_tables(next_week, schedule, standings, table)
+        posts = {community: construct_post_content(next_week, table) for community, table in tables.items()}
+    if preview:
+        for community, content in posts.items():
+            print(f"/s/{community}: {title}\n\n{content}\n")
+        return
+
+    # Each community's schedule is posted concurrently
+    with span('publish'), FanoutPublisher() as publisher:
+        results, errors = publisher.publish({
+            community: partial(post_to_squabblr, title, content, community) for community, content in posts.items()
+        })
+    log_connection_stats()
+    if errors:
+        posted = ', '.join(f"/s/{community}" for community in results) or "none"
+        raise RuntimeError(f"The {next_week} schedule failed to post to {len(errors)} community(ies); posted to: {posted}.")
+
+    logging.info("Script completed successfully.")
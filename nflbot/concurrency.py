@@ -0,0 +1,37 @@
+"""Per-host concurrency limits for fanned-out HTTP work."""
+import os
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+from nflbot.config import SQUABBLR_BASE
+
+SQUABBLR_HOST = urlparse(SQUABBLR_BASE).hostname
+DEFAULT_HOST_LIMITS = {
+    SQUABBLR_HOST: int(os.environ.get('NFLBOT_SQUABBLR_CONCURRENCY', 4)),
+}
+
+
+class HostLimiter:
+    """Cap the number of in-flight requests per host.
+
+    Hosts without a configured limit are not throttled.
+    """
+
+    def __init__(self, limits=None):
+        self.limits = dict(DEFAULT_HOST_LIMITS if limits is None else limits)
+        self._semaphores = {
+            host: threading.BoundedSemaphore(limit)
+            for host, limit in self.limits.items()
+            if limit > 0
+        }
+
+    @contextmanager
+    def slot(self, url_or_host):
+        host = urlparse(url_or_host).hostname or url_or_host
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            yield
+            return
+        with semaphore:
+            yield
@@ -0,0 +1,31 @@
+"""Base URLs, credentials and gist locations shared by every command.
+
+Each base URL can be pointed somewhere else through the environment, e.g.
+at the local stand-in servers in bench/fake_servers.py.
+"""
+import os
+
+ESPN_SITE_API = os.environ.get('NFLBOT_ESPN_SITE_API', 'https://site.api.espn.com').rstrip('/')
+ESPN_CDN = os.environ.get('NFLBOT_ESPN_CDN', 'https://cdn.espn.com').rstrip('/')
+GITHUB_API = os.environ.get('NFLBOT_GITHUB_API', 'https://api.github.com').rstrip('/')
+GIST_RAW = os.environ.get('NFLBOT_GIST_RAW', 'https://gist.githubusercontent.com').rstrip('/')
+SQUABBLR_BASE = os.environ.get('NFLBOT_SQUABBLR_BASE', 'https://squabblr.co').rstrip('/')
+GIST_OWNER = 'amightybeard'
+
+# Where the local SQLite store is kept between runs
+CACHE_DIR = os.environ.get('NFLBOT_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'nflbot'))
+
+SQUABBLR_TOKEN = os.environ.get('SQUABBLES_TOKEN')
+GITHUB_TOKEN = os.environ.get('NFLBOT_WRITE_TO_GIST')
+GIST_ID_SCHEDULES = os.environ.get('NFLBOT_SCHEDULES_GIST')
+GIST_FILENAME_SCHEDULES = 'nfl-schedule.csv'
+GIST_ID_STANDINGS = os.environ.get('NFLBOT_STANDINGS_GIST')
+GIST_FILENAME_STANDINGS = 'nfl-standings.csv'
+
+
+def gist_raw_url(gist_id, filename):
+    return f"{GIST_RAW}/{GIST_OWNER}/{gist_id}/raw/{filename}"
+
+
+GIST_URL_SCHEDULES = gist_raw_url(GIST_ID_SCHEDULES, GIST_FILENAME_SCHEDULES)
+GIST_URL_STANDINGS = gist_raw_url(GIST_ID_STANDINGS, GIST_FILENAME_STANDINGS)
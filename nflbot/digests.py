@@ -0,0 +1,63 @@
+"""Digests of the last-published scoreboard section for each gamethread.
+
+The digests live in a JSON file next to the schedule CSV in the schedules
+gist so they survive between updater runs.
+"""
+import hashlib
+import json
+import logging
+import threading
+
+DIGESTS_FILENAME = 'nfl-gamethread-digests.json'
+
+
+def scoreboard_digest(scoreboard_section):
+    """Return a short, stable digest of a rendered scoreboard section."""
+    return hashlib.sha1(scoreboard_section.encode('utf-8')).hexdigest()
+
+
+class DigestStore:
+    """Map Squabblr hash IDs to the digest of their last published scoreboard."""
+
+    def __init__(self, digests=None):
+        self.digests = dict(digests or {})
+        self.dirty = False
+        self.skipped = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_content(cls, content, filename=DIGESTS_FILENAME):
+        """Build the store from the file's content, or an empty store if the file is missing."""
+        if content is None:
+            logging.info(f"No {filename} in the gist yet; every gamethread will be published.")
+            return cls()
+        return cls(json.loads(content or '{}'))
+
+    def __contains__(self, hash_id):
+        with self._lock:
+            return hash_id in self.digests
+
+    def is_unchanged(self, hash_id, digest):
+        with self._lock:
+            unchanged = self.digests.get(hash_id) == digest
+            if unchanged:
+                self.skipped += 1
+            return unchanged
+
+    def record(self, hash_id, digest):
+        with self._lock:
+            if self.digests.get(hash_id) != digest:
+                self.digests[hash_id] = digest
+                self.dirty = True
+
+    def prune(self, active_hash_ids):
+        """Drop digests for gamethreads that are no longer being updated."""
+        active = {str(hash_id) for hash_id in active_hash_ids}
+        with self._lock:
+            for hash_id in list(self.digests):
+                if hash_id not in active:
+                    del self.digests[hash_id]
+                    self.dirty = True
+
+    def dumps(self):
+        return json.dumps(self.digests, indent=2, sort_keys=True)
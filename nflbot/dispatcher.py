@@ -0,0 +1,131 @@
+"""Rate-limit-aware dispatcher for Squabblr API calls.
+
+Calls are paced by a token bucket instead of fixed sleeps, so a burst of
+posts goes out as fast as Squabblr allows. A 429 (or a 503 carrying
+Retry-After) pauses the whole bucket for the time the server asked for;
+without a Retry-After the call backs off exponentially with full jitter.
+"""
+import logging
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from nflbot.config import SQUABBLR_BASE
+from nflbot.http_client import get_session
+from nflbot.metrics import get_metrics
+
+SQUABBLR_API = f'{SQUABBLR_BASE}/api'
+SQUABBLR_RATE = float(os.environ.get('NFLBOT_SQUABBLR_RATE', 1.0))    # sustained calls per second
+SQUABBLR_BURST = int(os.environ.get('NFLBOT_SQUABBLR_BURST', 5))       # calls allowed back to back
+MAX_ATTEMPTS = int(os.environ.get('NFLBOT_SQUABBLR_ATTEMPTS', 5))
+BASE_BACKOFF = 1.0
+MAX_BACKOFF = 60.0
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+
+class TokenBucket:
+    """Thread-safe token bucket that can also be paused until a given time."""
+
+    def __init__(self, rate, capacity, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                else:
+                    wait = (1 - self.tokens) / self.rate
+            self._sleep(wait)
+
+    def pause(self, seconds):
+        """Hold back every caller for the given number of seconds."""
+        with self._lock:
+            now = self._clock()
+            self._paused_until = max(self._paused_until, now + seconds)
+            self.tokens = 0.0
+            self._updated = now
+
+
+def retry_after_seconds(response):
+    """Return the Retry-After delay in seconds, or None when the header is missing or invalid."""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt, base=BASE_BACKOFF, cap=MAX_BACKOFF):
+    """Exponential backoff with full jitter for the given 1-based attempt."""
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class SquabblrDispatcher:
+    """Send Squabblr API calls through a shared token bucket with 429 handling."""
+
+    def __init__(self, bucket=None, max_attempts=MAX_ATTEMPTS):
+        self.bucket = bucket or TokenBucket(SQUABBLR_RATE, SQUABBLR_BURST)
+        self.max_attempts = max_attempts
+        self.throttled = 0
+
+    def request(self, method, path, **kwargs):
+        """Send a call to the Squabblr API and return the final response."""
+        url = f"{SQUABBLR_API}/{path.lstrip('/')}"
+        for attempt in range(1, self.max_attempts + 1):
+            self.bucket.acquire()
+            response = get_session().request(method, url, **kwargs)
+            delay = retry_after_seconds(response)
+            throttled = response.status_code == 429 or (response.status_code == 503 and delay is not None)
+            if not throttled or attempt == self.max_attempts:
+                return response
+
+            self.throttled += 1
+            get_metrics().count('squabblr_throttled')
+            if delay is None:
+                delay = backoff_delay(attempt)
+            logging.warning(f"Squabblr throttled {method} {path} ({response.status_code}); retrying in {delay:.1f}s...")
+            self.bucket.pause(delay)
+        return response
+
+    def post(self, path, **kwargs):
+        return self.request('POST', path, **kwargs)
+
+    def patch(self, path, **kwargs):
+        return self.request('PATCH', path, **kwargs)
+
+
+def get_dispatcher():
+    """Return the process-wide Squabblr dispatcher, creating it on first use."""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = SquabblrDispatcher()
+        return _dispatcher
@@ -0,0 +1,107 @@
+"""Compact decoding of ESPN scoreboard and standings payloads.
+
+ESPN sends news, odds, broadcasts, leaders and play details alongside the
+handful of fields the bot reads. The scoreboard parser keeps only those
+fields. The records keep ESPN's nesting, so code written against the full
+payload keeps working on them.
+
+Scoreboards are decoded one event at a time: the top-level object is
+walked by hand and each event is handed to the C decoder on its own, then
+cut down before the next one is read, so only one full event is ever
+alive. Pruning walks just the kept keys, so the unwanted subtrees cost
+nothing beyond the C decode. This saves memory, not time: the hand walk
+is slower than one json.loads. Standings responses are small and have no
+large array to stream, so they are decoded with plain json.loads.
+"""
+import json
+import re
+from json.decoder import scanstring
+
+# Every key the updater and scheduler read from a scoreboard event
+SCOREBOARD_KEYS = frozenset({
+    'events', 'id', 'competitions', 'competitors', 'homeAway', 'team', 'displayName', 'abbreviation',
+    'score', 'linescores', 'value', 'status', 'type', 'name', 'state', 'completed', 'period', 'clock',
+    'displayClock',
+})
+
+_decoder = json.JSONDecoder()
+_whitespace = re.compile(r'[ \t\n\r]*')
+
+
+def prune(value, keys):
+    """Return value with only the given keys kept in every object, at any depth."""
+    if isinstance(value, dict):
+        return {key: prune(item, keys) for key, item in value.items() if key in keys}
+    if isinstance(value, list):
+        return [prune(item, keys) for item in value]
+    return value
+
+
+def _skip(text, pos):
+    return _whitespace.match(text, pos).end()
+
+
+def _expect(text, pos, characters, message):
+    if pos >= len(text) or text[pos] not in characters:
+        raise json.JSONDecodeError(message, text, pos)
+    return text[pos]
+
+
+def _decode_items(text, pos, keys):
+    """Decode the array starting at pos item by item, pruning each; return (items, end)."""
+    items = []
+    pos = _skip(text, pos + 1)
+    if text.startswith(']', pos):
+        return items, pos + 1
+    while True:
+        item, pos = _decoder.raw_decode(text, pos)
+        items.append(prune(item, keys))
+        pos = _skip(text, pos)
+        if _expect(text, pos, ',]', "Expecting ',' delimiter") == ']':
+            return items, pos + 1
+        pos = _skip(text, pos + 1)
+
+
+def loads_pruned(content, keys, stream):
+    """Decode a JSON object keeping only the given keys in every object, at any depth.
+
+    The array under the top-level key stream is decoded one item at a time,
+    so its items never all exist in full at once.
+    """
+    text = content.decode('utf-8') if isinstance(content, bytes) else content
+    result = {}
+    pos = _skip(text, 0)
+    _expect(text, pos, '{', "Expecting value")
+    pos = _skip(text, pos + 1)
+    done = text.startswith('}', pos)
+    while not done:
+        _expect(text, pos, '"', "Expecting property name enclosed in double quotes")
+        key, pos = scanstring(text, pos + 1)
+        pos = _skip(text, pos)
+        _expect(text, pos, ':', "Expecting ':' delimiter")
+        pos = _skip(text, pos + 1)
+        if key == stream and text.startswith('[', pos):
+            value, pos = _decode_items(text, pos, keys)
+        else:
+            value, pos = _decoder.raw_decode(text, pos)
+            value = prune(value, keys) if key in keys else None
+        if key in keys:
+            result[key] = value
+        pos = _skip(text, pos)
+        done = _expect(text, pos, ',}', "Expecting ',' delimiter") == '}'
+        if not done:
+            pos = _skip(text, pos + 1)
+    end = _skip(text, pos + 1)
+    if end != len(text):
+        raise json.JSONDecodeError("Extra data", text, end)
+    return result
+
+
+def parse_scoreboard(content):
+    """Decode a scoreboard response down to ids, competitors, linescores and status."""
+    return loads_pruned(content, SCOREBOARD_KEYS, stream='events')
+
+
+def parse_standings(content):
+    """Decode a standings response."""
+    return json.loads(content)
@@ -0,0 +1,104 @@
+"""Publish one rendered thread to several Squabblr communities at once.
+
+Communities come from NFLBOT_COMMUNITIES, a comma-separated list such as
+"NFL,buffalobills=BUF,dolphins=MIA". A name on its own gets every game; a
+name followed by "=TEAM+TEAM" only gets games involving those teams (by
+short name). The first community is the primary one. It always gets every
+game, and its post keeps using the schedule's Squabblr Hash ID column, so
+a single-community setup behaves exactly as before. The hash IDs of every
+other community's post go in the Community Hash IDs column as
+"name=hash;name=hash".
+"""
+import logging
+import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+COMMUNITY_HASHES_FIELD = 'Community Hash IDs'
+
+Community = namedtuple('Community', ['name', 'teams'])
+
+
+def parse_communities(text):
+    """Parse the NFLBOT_COMMUNITIES format into a list of Community records."""
+    communities = []
+    for item in (text or '').split(','):
+        name, _, teams = item.strip().partition('=')
+        if name:
+            communities.append(Community(name, frozenset(team for team in teams.split('+') if team)))
+    return communities or [Community('NFL', frozenset())]
+
+
+COMMUNITIES = parse_communities(os.environ.get('NFLBOT_COMMUNITIES', 'NFL'))
+PRIMARY_COMMUNITY = COMMUNITIES[0].name
+
+
+def communities_for(game, communities=COMMUNITIES):
+    """Return the names of the communities that should get a thread for the game."""
+    shorts = {game['Home Team Short'], game['Away Team Short']}
+    return [
+        community.name for position, community in enumerate(communities)
+        if position == 0 or not community.teams or community.teams & shorts
+    ]
+
+
+def parse_hash_ids(text):
+    """Parse a Community Hash IDs value into {community: hash_id}."""
+    pairs = (item.partition('=') for item in (text or '').split(';') if item)
+    return {name: hash_id for name, _, hash_id in pairs if hash_id}
+
+
+def format_hash_ids(hash_ids):
+    return ';'.join(f"{name}={hash_id}" for name, hash_id in sorted(hash_ids.items()))
+
+
+def read_hash_ids(game, primary=PRIMARY_COMMUNITY):
+    """Return {community: hash_id} for every post the game already has."""
+    hash_ids = parse_hash_ids(game.get(COMMUNITY_HASHES_FIELD))
+    if game['Squabblr Hash ID']:
+        hash_ids[primary] = game['Squabblr Hash ID']
+    return hash_ids
+
+
+def write_hash_ids(game, hash_ids, primary=PRIMARY_COMMUNITY):
+    """Store hash IDs on the game; the schedule must have the Community Hash IDs column."""
+    others = {name: hash_id for name, hash_id in hash_ids.items() if name != primary}
+    if primary in hash_ids:
+        game['Squabblr Hash ID'] = hash_ids[primary]
+    if others or game.get(COMMUNITY_HASHES_FIELD):
+        game[COMMUNITY_HASHES_FIELD] = format_hash_ids(others)
+
+
+class FanoutPublisher:
+    """Run one publish call per community concurrently and collect the results.
+
+    A single call runs in the caller's thread, so a one-community setup
+    never waits on the pool.
+    """
+
+    def __init__(self, workers=None):
+        self._executor = ThreadPoolExecutor(max_workers=workers or max(len(COMMUNITIES), 1))
+
+    def publish(self, calls):
+        """Run {community: callable} concurrently; return ({community: result}, {community: error})."""
+        if len(calls) == 1:
+            pending = dict(calls)
+        else:
+            pending = {community: self._executor.submit(call).result for community, call in calls.items()}
+        results, errors = {}, {}
+        for community, result in pending.items():
+            try:
+                results[community] = result()
+            except Exception as e:
+                logging.error(f"Publishing to /s/{community} failed: {e}")
+                errors[community] = e
+        return results, errors
+
+    def close(self):
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,121 @@
+"""Per-game state remembered between updater runs, and the changes between two states.
+
+The state of every live game as it was last published is kept in a JSON
+file next to the schedule CSV in the schedules gist. Each run compares the
+fresh scoreboard against it and gets typed change events, so a stalled
+clock can be told apart from a score, a new quarter or a final.
+"""
+import json
+import logging
+import os
+import threading
+from collections import namedtuple
+
+STATES_FILENAME = 'nfl-game-states.json'
+
+# Change event kinds, roughly in order of importance
+GAME_STARTED = 'start'      # first time the game is seen live
+GAME_FINAL = 'final'
+SCORE_CHANGED = 'score'
+PERIOD_CHANGED = 'period'
+STATUS_CHANGED = 'status'   # halftime, delays and other status moves that are not final
+CLOCK_TICK = 'clock'        # only the game clock moved
+
+PUBLISH_CLOCK_TICKS = os.environ.get('NFLBOT_PUBLISH_CLOCK_TICKS', '0') == '1'
+PUBLISHED_CHANGES = frozenset(
+    {GAME_STARTED, GAME_FINAL, SCORE_CHANGED, PERIOD_CHANGED, STATUS_CHANGED}
+    | ({CLOCK_TICK} if PUBLISH_CLOCK_TICKS else set())
+)
+
+GameState = namedtuple('GameState', [
+    'status', 'period', 'clock', 'home_score', 'away_score', 'home_linescores', 'away_linescores'
+])
+
+ChangeEvent = namedtuple('ChangeEvent', ['kind', 'game_id', 'before', 'after'])
+
+
+def game_state_from_event(event):
+    """Return the GameState of an ESPN scoreboard event."""
+    competition = event['competitions'][0]
+    status = competition['status']
+    sides = {}
+    for competitor in competition['competitors']:
+        linescores = tuple(int(item['value']) for item in competitor.get('linescores', []))
+        sides[competitor['homeAway']] = (int(competitor.get('score') or 0), linescores)
+    home_score, home_linescores = sides.get('home', (0, ()))
+    away_score, away_linescores = sides.get('away', (0, ()))
+    return GameState(
+        status['type']['name'], int(status.get('period', 0)), str(status.get('displayClock', '')),
+        home_score, away_score, home_linescores, away_linescores,
+    )
+
+
+def _scores(state):
+    return state.home_score, state.away_score, state.home_linescores, state.away_linescores
+
+
+def diff_states(game_id, before, after):
+    """Return the change events between two states of a game; an empty list if nothing changed."""
+    if before is None:
+        return [ChangeEvent(GAME_STARTED, game_id, None, after)]
+    changes = []
+    if after.status != before.status:
+        kind = GAME_FINAL if after.status == 'STATUS_FINAL' else STATUS_CHANGED
+        changes.append(ChangeEvent(kind, game_id, before, after))
+    if _scores(after) != _scores(before):
+        changes.append(ChangeEvent(SCORE_CHANGED, game_id, before, after))
+    if after.period != before.period:
+        changes.append(ChangeEvent(PERIOD_CHANGED, game_id, before, after))
+    if not changes and after.clock != before.clock:
+        changes.append(ChangeEvent(CLOCK_TICK, game_id, before, after))
+    return changes
+
+
+def should_publish(changes):
+    """Return True if any of the changes is worth editing the gamethread for."""
+    return any(change.kind in PUBLISHED_CHANGES for change in changes)
+
+
+class GameStateStore:
+    """Map ESPN game ids to the GameState last published for them."""
+
+    def __init__(self, states=None):
+        self.states = dict(states or {})
+        self.dirty = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_content(cls, content, filename=STATES_FILENAME):
+        """Build the store from the file's content, or an empty store if the file is missing."""
+        if content is None:
+            logging.info(f"No {filename} in the gist yet; every live game counts as just started.")
+            return cls()
+        states = {}
+        for game_id, values in json.loads(content or '{}').items():
+            values[5:7] = [tuple(values[5]), tuple(values[6])]
+            states[game_id] = GameState(*values)
+        return cls(states)
+
+    def compare(self, game_id, state):
+        """Return the change events between the last published state and this one."""
+        with self._lock:
+            return diff_states(str(game_id), self.states.get(str(game_id)), state)
+
+    def record(self, game_id, state):
+        """Remember the state once it has been published."""
+        with self._lock:
+            if self.states.get(str(game_id)) != state:
+                self.states[str(game_id)] = state
+                self.dirty = True
+
+    def prune(self, active_game_ids):
+        """Drop states for games that are no longer being updated."""
+        active = {str(game_id) for game_id in active_game_ids}
+        with self._lock:
+            for game_id in list(self.states):
+                if game_id not in active:
+                    del self.states[game_id]
+                    self.dirty = True
+
+    def dumps(self):
+        return json.dumps({game_id: list(state) for game_id, state in self.states.items()}, indent=2, sort_keys=True)
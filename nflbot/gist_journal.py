@@ -0,0 +1,103 @@
+"""Write-behind journal for gist edits made during a run.
+
+Scripts record each row change as it happens and flush once at the end:
+every dirty file in the same gist goes out in a single multi-file PATCH,
+and nothing is written when nothing changed.
+"""
+import logging
+
+from nflbot.config import GITHUB_API
+from nflbot.http_client import get_session
+
+
+def fetch_gist_files(gist_id, token):
+    """Return {filename: content} for every file in the gist, read through the gist API.
+
+    Unlike the raw gist URL, the API is not CDN-cached, so use this before
+    rewriting a file based on its contents.
+    """
+    headers = {
+        'Authorization': f'token {token}',
+        'Accept': 'application/vnd.github.v3+json'
+    }
+    response = get_session().get(f'{GITHUB_API}/gists/{gist_id}', headers=headers)
+    response.raise_for_status()  # Raise an exception for HTTP errors
+    return {
+        filename: gist_file['content']
+        for filename, gist_file in response.json().get('files', {}).items()
+        if gist_file
+    }
+
+
+def fetch_gist_file(gist_id, filename, token):
+    """Return a file's current content from the gist API, or None if the gist has no such file."""
+    return fetch_gist_files(gist_id, token).get(filename)
+
+
+def patch_gist(gist_id, files, token):
+    """Replace the content of several files in one gist with a single PATCH."""
+    headers = {
+        'Authorization': f'token {token}',
+        'Accept': 'application/vnd.github.v3+json'
+    }
+    data = {
+        'files': {
+            filename: {
+                'content': content
+            }
+            for filename, content in files.items()
+        }
+    }
+    response = get_session().patch(f'{GITHUB_API}/gists/{gist_id}', headers=headers, json=data)
+    response.raise_for_status()  # Raise an exception for HTTP errors
+
+
+class GistJournal:
+    """Collect gist file changes and write them back in as few PATCHes as possible."""
+
+    def __init__(self, token):
+        self.token = token
+        self._renderers = {}
+        self._staged = {}
+        self._changes = {}
+
+    def track(self, gist_id, filename, render):
+        """Register a callable that renders the file's content when it is flushed."""
+        self._renderers[(gist_id, filename)] = render
+
+    def record(self, gist_id, filename, change):
+        """Note a change to a tracked file; the file is rendered and written at flush time."""
+        self._changes.setdefault((gist_id, filename), []).append(change)
+
+    def write(self, gist_id, filename, content):
+        """Stage already-rendered content for a file."""
+        self._staged[(gist_id, filename)] = content
+        self._changes.setdefault((gist_id, filename), [])
+
+    @property
+    def dirty(self):
+        return bool(self._changes)
+
+    def flush(self):
+        """Write every changed file, one PATCH per gist, and return the number of PATCHes sent."""
+        by_gist = {}
+        for (gist_id, filename), changes in self._changes.items():
+            if (gist_id, filename) in self._staged:
+                content = self._staged[(gist_id, filename)]
+            else:
+                content = self._renderers[(gist_id, filename)]()
+            by_gist.setdefault(gist_id, {})[filename] = content
+            for change in changes:
+                logging.info(f"{filename}: {change}")
+
+        if not by_gist:
+            logging.info("No gist changes to write.")
+            return 0
+
+        for gist_id, files in by_gist.items():
+            logging.info(f"Writing {', '.join(sorted(files))} to gist {gist_id} in one update...")
+            patch_gist(gist_id, files, self.token)
+
+        self._staged.clear()
+        self._changes.clear()
+        return len(by_gist)
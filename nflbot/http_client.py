@@ -0,0 +1,134 @@
+"""Shared HTTP client for ESPN, GitHub and Squabblr.
+
+Every request in the bot goes through one `requests.Session` so each host
+keeps a pool of keep-alive connections instead of paying a fresh TCP and
+TLS handshake per call. The session applies default timeouts, asks for
+gzip, and retries connection errors and 5xx responses on idempotent
+methods. Squabblr gets its own pool whose retries leave 429s and 503s
+with Retry-After alone, so the dispatcher's token bucket sees every
+throttle.
+
+requests and urllib3 are only imported when the session is first needed;
+importing them takes longer than a whole run with nothing to do.
+"""
+import logging
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
+from nflbot.config import SQUABBLR_BASE
+from nflbot.metrics import get_metrics
+
+CONNECT_TIMEOUT = float(os.environ.get('NFLBOT_CONNECT_TIMEOUT', 5))
+READ_TIMEOUT = float(os.environ.get('NFLBOT_READ_TIMEOUT', 30))
+POOL_CONNECTIONS = 8   # hosts kept in the pool manager
+POOL_MAXSIZE = 16      # connections kept per host, enough for the updater's worker pool
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _timeout_session_class():
+    import requests
+
+    class TimeoutSession(requests.Session):
+        """A session that fills in the default timeout and times every call for the run metrics."""
+
+        def request(self, method, url, **kwargs):
+            kwargs.setdefault('timeout', (CONNECT_TIMEOUT, READ_TIMEOUT))
+            host = urlparse(url).netloc
+            started = time.perf_counter()
+            try:
+                response = super().request(method, url, **kwargs)
+            except requests.RequestException:
+                get_metrics().observe_request(host, time.perf_counter() - started)
+                raise
+            get_metrics().observe_request(host, time.perf_counter() - started, response.status_code, _retries(response))
+            return response
+
+    return TimeoutSession
+
+
+def _retries(response):
+    """Return how many times urllib3 retried the call behind a response."""
+    retries = getattr(response.raw, 'retries', None)
+    return len(retries.history) if retries is not None else 0
+
+
+def _retry_policy(throttled_by_caller=False):
+    from urllib3.util.retry import Retry
+
+    class ThrottleAwareRetry(Retry):
+        """Leaves throttling responses to the caller instead of sleeping on them inside the pool."""
+
+        def is_retry(self, method, status_code, has_retry_after=False):
+            if status_code == 429 or (status_code == 503 and has_retry_after):
+                return False
+            return super().is_retry(method, status_code, has_retry_after)
+
+    # Connection errors are always safe to retry; reads and 5xx responses only for
+    # methods that can be repeated. POST is left out so a post is never duplicated.
+    return (ThrottleAwareRetry if throttled_by_caller else Retry)(
+        total=3,
+        connect=3,
+        read=2,
+        status=3,
+        backoff_factor=0.5,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset({'GET', 'HEAD', 'PATCH'}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+def get_session():
+    """Return the process-wide session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            from requests.adapters import HTTPAdapter
+
+            session = _timeout_session_class()()
+            session.headers['Accept-Encoding'] = 'gzip, deflate'
+            adapter = HTTPAdapter(
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE,
+                max_retries=_retry_policy(),
+            )
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            # The Squabblr dispatcher paces calls and handles 429s itself
+            session.mount(f'{SQUABBLR_BASE}/', HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=POOL_MAXSIZE,
+                max_retries=_retry_policy(throttled_by_caller=True),
+            ))
+            _session = session
+        return _session
+
+
+def connection_stats():
+    """Return {host: {'requests': n, 'connections': m}} for every pooled host so far."""
+    if _session is None:
+        return {}
+    stats = {}
+    for adapter in set(_session.adapters.values()):
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools[key]
+            if pool is None:
+                continue
+            host = stats.setdefault(pool.host, {'requests': 0, 'connections': 0})
+            host['requests'] += pool.num_requests
+            host['connections'] += pool.num_connections
+    return stats
+
+
+def log_connection_stats():
+    for host, counts in sorted(connection_stats().items()):
+        reused = counts['requests'] - counts['connections']
+        logging.info(
+            f"{host}: {counts['requests']} request(s) over {counts['connections']} connection(s), "
+            f"{max(reused, 0)} reused."
+        )
@@ -0,0 +1,295 @@
+"""Local SQLite store for the schedule and standings, mirrored to the gists.
+
+Reads come from a SQLite file in the cache directory. It is refreshed from
+the raw gist URLs with conditional requests, so an unchanged gist costs one
+304. Post hash IDs and status changes are written to the store one row at
+a time, each in its own transaction, and flagged as unsynced. At the end
+of a run the unsynced rows are laid over a fresh copy of the gist and
+written back in the run's single journal flush.
+
+Only the bot's own columns (Squabblr Hash ID, Community Hash IDs and
+Status) are ever synced from the store; ESPN columns always come from the
+gist. When a local change meets a different value in the gist, the
+further-along status and the non-empty hash IDs win. Two runs that post and finalise the same game
+at about the same time therefore cannot undo each other.
+
+The store also keeps the rendered weekly schedule tables (see
+nflbot.week_tables), tagged with the gist versions they were built from.
+"""
+import csv
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from io import StringIO
+
+from nflbot.fanout import COMMUNITY_HASHES_FIELD, format_hash_ids, parse_hash_ids
+from nflbot.gist_journal import fetch_gist_file
+from nflbot.http_client import get_session
+from nflbot.metrics import get_metrics
+from nflbot.schedule import read_schedule
+from nflbot.scoreboard import game_id_from_link
+from nflbot.standings import StandingsIndex
+from nflbot.store_reader import DB_PATH, schedule_from_rows
+
+# How far along a game is; a synced status never moves backwards
+STATUS_RANK = {'STATUS_SCHEDULED': 0, 'STATUS_IN_PROGRESS': 1, 'STATUS_FINAL': 2}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    game_id TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT '',
+    hash_id TEXT NOT NULL DEFAULT '',
+    row TEXT NOT NULL,
+    dirty INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS games_position ON games (position);
+CREATE INDEX IF NOT EXISTS games_dirty ON games (game_id) WHERE dirty = 1;
+CREATE TABLE IF NOT EXISTS standings (
+    team TEXT PRIMARY KEY,
+    position INTEGER NOT NULL,
+    row TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS week_tables (
+    week TEXT PRIMARY KEY,
+    versions TEXT NOT NULL,
+    content TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def row_game_id(row, position):
+    """Return the ESPN game id of a schedule row, or a stand-in for rows without a link."""
+    link = row.get('Gamecast Link')
+    return game_id_from_link(link) if link else f"row-{position}"
+
+
+def merge_bot_fields(local, remote):
+    """Return {column: value} for the bot's columns, combining a local unsynced row with the gist's copy."""
+    merged = {
+        'Squabblr Hash ID': local['Squabblr Hash ID'] or remote['Squabblr Hash ID'],
+        'Status': max((local['Status'], remote['Status']), key=lambda value: STATUS_RANK.get(value, -1)),
+    }
+    communities = {**parse_hash_ids(remote.get(COMMUNITY_HASHES_FIELD)), **parse_hash_ids(local.get(COMMUNITY_HASHES_FIELD))}
+    if communities:
+        merged[COMMUNITY_HASHES_FIELD] = format_hash_ids(communities)
+    return merged
+
+
+class LocalStore:
+    """SQLite-backed schedule rows and standings with per-row sync flags."""
+
+    def __init__(self, path=DB_PATH):
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._db = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.executescript(SCHEMA)
+
+    @contextmanager
+    def transaction(self):
+        """Run the block in one write transaction, taking the write lock up front."""
+        with self._lock:
+            self._db.execute('BEGIN IMMEDIATE')
+            try:
+                yield self._db
+            except BaseException:
+                self._db.execute('ROLLBACK')
+                raise
+            self._db.execute('COMMIT')
+
+    def _meta(self, key, default=None):
+        row = self._db.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def _set_meta(self, db, key, value):
+        db.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, json.dumps(value)))
+
+    # Pulling from the gists
+
+    def _pull(self, url, table, load):
+        """Fetch url unless the stored validators still match, and load the body if it changed."""
+        validators = self._meta(f"validators:{url}", {})
+        has_rows = self._db.execute(f'SELECT 1 FROM {table} LIMIT 1').fetchone() is not None
+        headers = {}
+        if has_rows and validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if has_rows and validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+
+        response = get_session().get(url, headers=headers)
+        if response.status_code == 304:
+            logging.info(f"Gist file unchanged, reading {table} from the local store.")
+            get_metrics().count('gist_cache_hits')
+            with self.transaction() as db:
+                self._set_meta(db, f"pulled_at:{url}", time.time())
+            return
+        response.raise_for_status()  # Raise an exception for HTTP errors
+        with self.transaction() as db:
+            load(db, response.text)
+            self._set_meta(db, f"validators:{url}", {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+            })
+            self._set_meta(db, f"pulled_at:{url}", time.time())
+
+    def pull_schedule(self, url):
+        """Refresh the schedule rows from the raw gist URL and return them as a ScheduleStore."""
+        self._pull(url, 'games', lambda db, text: self._import_schedule(db, read_schedule(text)))
+        return self.schedule()
+
+    def pull_standings(self, url):
+        """Refresh the standings from the raw gist URL and return them as a StandingsIndex."""
+        self._pull(url, 'standings', self._import_standings)
+        return self.standings()
+
+    def version(self, url):
+        """Return the ETag, or failing that the Last-Modified, of the last pull from url; None if unknown."""
+        with self._lock:
+            validators = self._meta(f"validators:{url}", {})
+        return validators.get('etag') or validators.get('last_modified')
+
+    def _import_schedule(self, db, schedule):
+        # Unsynced local changes survive a pull; everything else is replaced by the gist's copy
+        local = {
+            game_id: (json.loads(row), dirty)
+            for game_id, row, dirty in db.execute('SELECT game_id, row, dirty FROM games')
+        }
+        seen = set()
+        for game in schedule:
+            row = game.to_dict()
+            game_id = row_game_id(row, game.position)
+            seen.add(game_id)
+            dirty = 0
+            if game_id in local and local[game_id][1]:
+                merged = merge_bot_fields(local[game_id][0], row)
+                dirty = int(any(row.get(name) != value for name, value in merged.items()))
+                row.update(merged)
+            db.execute(
+                'INSERT OR REPLACE INTO games (game_id, position, status, hash_id, row, dirty) VALUES (?, ?, ?, ?, ?, ?)',
+                (game_id, game.position, row['Status'], row['Squabblr Hash ID'], json.dumps(row), dirty)
+            )
+        for game_id, (row, dirty) in local.items():
+            if game_id not in seen and not dirty:
+                db.execute('DELETE FROM games WHERE game_id = ?', (game_id,))
+        self._set_meta(db, 'schedule_fields', schedule.fieldnames)
+
+    def _import_standings(self, db, text):
+        db.execute('DELETE FROM standings')
+        db.executemany(
+            'INSERT OR REPLACE INTO standings (team, position, row) VALUES (?, ?, ?)',
+            ((row['Team'], position, json.dumps(row)) for position, row in enumerate(csv.DictReader(StringIO(text))))
+        )
+
+    # Local reads and writes
+
+    def schedule(self):
+        """Return every schedule row, in gist order, as a ScheduleStore."""
+        with self._lock:
+            fieldnames = self._meta('schedule_fields', [])
+            rows = [json.loads(row) for (row,) in self._db.execute('SELECT row FROM games ORDER BY position')]
+        return schedule_from_rows(fieldnames, rows)
+
+    def standings(self):
+        """Return the standings as a StandingsIndex."""
+        with self._lock:
+            rows = [json.loads(row) for (row,) in self._db.execute('SELECT row FROM standings ORDER BY position')]
+        return StandingsIndex.from_rows(rows)
+
+    def save_game(self, game):
+        """Write one game's current values in its own transaction and mark it unsynced."""
+        row = game.to_dict()
+        game_id = row_game_id(row, game.position)
+        with self.transaction() as db:
+            db.execute(
+                'INSERT OR REPLACE INTO games (game_id, position, status, hash_id, row, dirty) VALUES (?, ?, ?, ?, ?, 1)',
+                (game_id, game.position, row['Status'], row['Squabblr Hash ID'], json.dumps(row))
+            )
+
+    def unsynced(self):
+        """Return {game_id: row} for every row changed locally since the last sync."""
+        with self._lock:
+            return {
+                game_id: json.loads(row)
+                for game_id, row in self._db.execute('SELECT game_id, row FROM games WHERE dirty = 1')
+            }
+
+    def cached_week_table(self, week, versions):
+        """Return the week's rendered schedule table if it was built from these versions, else None."""
+        with self._lock:
+            row = self._db.execute(
+                'SELECT content FROM week_tables WHERE week = ? AND versions = ?', (week, json.dumps(list(versions)))
+            ).fetchone()
+        return row[0] if row else None
+
+    def save_week_tables(self, tables, versions):
+        """Replace the cached week tables with {week: table} built from these versions."""
+        with self.transaction() as db:
+            db.execute('DELETE FROM week_tables')
+            db.executemany(
+                'INSERT INTO week_tables (week, versions, content) VALUES (?, ?, ?)',
+                ((week, json.dumps(list(versions)), content) for week, content in tables.items())
+            )
+
+    # Pushing to the gist
+
+    def export_schedule(self, current, unsynced):
+        """Lay the unsynced rows' bot columns over the gist's current CSV and return the result."""
+        schedule = read_schedule(current)
+        for game in schedule:
+            local = unsynced.get(row_game_id({'Gamecast Link': game['Gamecast Link']}, game.position))
+            if local is None:
+                continue
+            merged = merge_bot_fields(local, game)
+            schedule.ensure_columns(merged)
+            for name, value in merged.items():
+                game[name] = value
+        return schedule.to_csv()
+
+    def stage_schedule(self, journal, gist_id, filename, token, current=None):
+        """Stage the unsynced rows in the journal; return the rows staged, for mark_synced().
+
+        current is the gist file's content if the caller already read it from
+        the gist API; otherwise it is read here. Only runs with local changes
+        touch the network.
+        """
+        unsynced = self.unsynced()
+        if not unsynced:
+            return {}
+        if current is None:
+            current = fetch_gist_file(gist_id, filename, token)
+        if current is None:
+            content = self.schedule().to_csv()
+        else:
+            content = self.export_schedule(current, unsynced)
+        journal.write(gist_id, filename, content)
+        return unsynced
+
+    def mark_synced(self, rows):
+        """Clear the unsynced flag on rows that were written, unless they changed again since."""
+        with self.transaction() as db:
+            for game_id, row in rows.items():
+                db.execute('UPDATE games SET dirty = 0 WHERE game_id = ? AND row = ?', (game_id, json.dumps(row)))
+
+
+def get_store():
+    """Return the process-wide local store, opening it on first use."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = LocalStore()
+        return _store
@@ -0,0 +1,203 @@
+"""Per-run timing spans and request metrics for the bot scripts.
+
+Each script run gets a RunMetrics that collects how long its phases took
+(load, fetch, render, publish, persist), how many requests went to each
+host and how long they took, and how often calls were retried. When the
+run finishes it appends one JSON line to runs.jsonl and rewrites
+<script>.prom in Prometheus text format, both under NFLBOT_METRICS_DIR.
+"""
+import atexit
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+METRICS_DIR = os.environ.get('NFLBOT_METRICS_DIR', 'metrics')
+RUNS_FILENAME = 'runs.jsonl'
+
+_current = None
+_unattached = None
+_current_lock = threading.Lock()
+
+
+class RunMetrics:
+    """Timing spans, per-host request stats and counters for one script run.
+
+    Span and request times are summed across threads, so a phase run by
+    several workers at once can add up to more than the run's wall time.
+    """
+
+    def __init__(self, script):
+        self.script = script
+        self.started_at = time.time()
+        self.status = None
+        self._started = time.perf_counter()
+        self._duration = None
+        self._spans = {}
+        self._requests = {}
+        self.counters = Counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, phase):
+        """Time the block and add it to the phase's total."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                span = self._spans.setdefault(phase, {'calls': 0, 'seconds': 0.0})
+                span['calls'] += 1
+                span['seconds'] += elapsed
+
+    def observe_request(self, host, seconds, status=None, retries=0):
+        """Record one HTTP call; status is None when it failed without a response."""
+        with self._lock:
+            stats = self._requests.setdefault(host, {
+                'requests': 0, 'seconds': 0.0, 'max_seconds': 0.0, 'errors': 0, 'retries': 0,
+            })
+            stats['requests'] += 1
+            stats['seconds'] += seconds
+            stats['max_seconds'] = max(stats['max_seconds'], seconds)
+            stats['retries'] += retries
+            if status is None or status >= 400:
+                stats['errors'] += 1
+
+    def count(self, name, value=1):
+        with self._lock:
+            self.counters[name] += value
+
+    @property
+    def duration(self):
+        if self._duration is not None:
+            return self._duration
+        return time.perf_counter() - self._started
+
+    def snapshot(self):
+        """Return everything collected so far as a JSON-serialisable dict."""
+        with self._lock:
+            return {
+                'script': self.script,
+                'started_at': round(self.started_at, 3),
+                'duration': round(self.duration, 6),
+                'status': self.status or 'running',
+                'spans': {phase: dict(span) for phase, span in self._spans.items()},
+                'requests': {host: dict(stats) for host, stats in self._requests.items()},
+                'counters': dict(self.counters),
+            }
+
+    def prometheus(self):
+        """Render the run in the Prometheus text exposition format."""
+        run = self.snapshot()
+        script = _label(run['script'])
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                label_text = ','.join([f'script="{script}"'] + [f'{key}="{_label(val)}"' for key, val in labels])
+                lines.append(f"{name}{{{label_text}}} {value}")
+
+        metric('nflbot_run_timestamp_seconds', 'gauge', "Unix time the run started.", [((), run['started_at'])])
+        metric('nflbot_run_duration_seconds', 'gauge', "Wall time of the run.", [((), run['duration'])])
+        metric('nflbot_run_success', 'gauge', "1 if the run finished without an error.",
+               [((), int(run['status'] == 'ok'))])
+        metric('nflbot_phase_seconds', 'gauge', "Time spent in each phase, summed across threads.",
+               [((('phase', phase),), span['seconds']) for phase, span in sorted(run['spans'].items())])
+        metric('nflbot_phase_calls', 'gauge', "Number of times each phase ran.",
+               [((('phase', phase),), span['calls']) for phase, span in sorted(run['spans'].items())])
+        requests = sorted(run['requests'].items())
+        for key, name, help_text in (
+            ('requests', 'nflbot_http_requests', "HTTP requests sent to each host."),
+            ('errors', 'nflbot_http_request_errors', "HTTP requests that failed or returned 4xx/5xx."),
+            ('retries', 'nflbot_http_retries', "Retries made by the HTTP client for each host."),
+            ('seconds', 'nflbot_http_request_seconds', "Total HTTP request latency for each host."),
+            ('max_seconds', 'nflbot_http_request_max_seconds', "Slowest HTTP request to each host."),
+        ):
+            metric(name, 'gauge', help_text, [((('host', host),), stats[key]) for host, stats in requests])
+        metric('nflbot_events', 'gauge', "Run-specific counters such as skipped edits and throttled calls.",
+               [((('name', name),), value) for name, value in sorted(run['counters'].items())])
+        return '\n'.join(lines) + '\n'
+
+    def finish(self, status='ok', directory=None):
+        """Stop the clock and write the run's metrics; later calls do nothing."""
+        with self._lock:
+            if self.status is not None:
+                return
+            self.status = status
+            self._duration = time.perf_counter() - self._started
+        spans = ', '.join(f"{phase} {span['seconds']:.2f}s" for phase, span in self.snapshot()['spans'].items())
+        logging.info(f"{self.script} {status} in {self._duration:.2f}s ({spans or 'no spans'}).")
+        try:
+            self.write(directory or METRICS_DIR)
+        except OSError as e:
+            logging.warning(f"Could not write run metrics for {self.script}: {e}")
+
+    def write(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, RUNS_FILENAME), 'a') as f:
+            f.write(json.dumps(self.snapshot(), sort_keys=True) + '\n')
+        # Replace the .prom file in one step so a textfile collector never reads half of it
+        path = os.path.join(directory, f"{self.script}.prom")
+        with open(path + '.tmp', 'w') as f:
+            f.write(self.prometheus())
+        os.replace(path + '.tmp', path)
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def start_run(script):
+    """Begin collecting metrics for a script run and make it the current run."""
+    global _current
+    run = RunMetrics(script)
+    with _current_lock:
+        _current = run
+    return run
+
+
+def get_metrics():
+    """Return the current run, or a throwaway one that is never written when no run was started."""
+    global _unattached
+    with _current_lock:
+        if _current is not None:
+            return _current
+        if _unattached is None:
+            _unattached = RunMetrics('unattached')
+        return _unattached
+
+
+def span(phase):
+    """Time a block as one phase of the current run."""
+    return get_metrics().span(phase)
+
+
+def instrumented(script):
+    """Decorate a script's main() so every call is recorded as one run."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            run = start_run(script)
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                run.finish('failed')
+                raise
+            run.finish()
+            return result
+        return wrapper
+    return decorator
+
+
+@atexit.register
+def _finish_at_exit():
+    # Scripts that crash before calling finish() still leave a record behind
+    if _current is not None and _current.status is None:
+        _current.finish('incomplete')
@@ -0,0 +1,111 @@
+"""Record ESPN scoreboard snapshots to a compact archive and read them back.
+
+An archive is gzipped JSON lines: a header line, then one line per snapshot
+holding its Unix time and the scoreboard events. Events are cut down to
+the fields the bot reads plus each game's kickoff date, and a snapshot
+identical to the one before it is not written again, so a full game day
+fits in a few hundred KiB. Each recorder appends a new gzip member, so
+several runs can add to the same file; reading treats it as one stream.
+
+Set NFLBOT_RECORD_SCOREBOARD to a path to record every scoreboard the bot
+fetches; bench/record_scoreboard.py polls ESPN on its own, and
+bench/replay_gameday.py plays an archive back through the updater.
+"""
+import atexit
+import gzip
+import json
+import os
+import threading
+import time
+
+from nflbot.espn import SCOREBOARD_KEYS, loads_pruned
+
+ARCHIVE_FORMAT = 'nflbot-scoreboard/1'
+# The schedule a replay builds needs each game's kickoff as well
+RECORDED_KEYS = SCOREBOARD_KEYS | {'date'}
+RECORD_PATH = os.environ.get('NFLBOT_RECORD_SCOREBOARD')
+
+_recorders = {}
+_recorders_lock = threading.Lock()
+
+
+class ScoreboardRecorder:
+    """Append timestamped scoreboard snapshots to an archive, skipping unchanged ones."""
+
+    def __init__(self, path, source=None):
+        self.path = path
+        self.source = source
+        self.written = 0
+        self.skipped = 0
+        self._last = None
+        self._file = None
+        self._lock = threading.Lock()
+
+    def record(self, content, at=None):
+        """Add a raw scoreboard response body; return True if it was written."""
+        events = loads_pruned(content, RECORDED_KEYS, stream='events').get('events', [])
+        line = json.dumps(events, separators=(',', ':'), sort_keys=True)
+        with self._lock:
+            if line == self._last:
+                self.skipped += 1
+                return False
+            if self._file is None:
+                directory = os.path.dirname(os.path.abspath(self.path))
+                os.makedirs(directory, exist_ok=True)
+                self._file = gzip.open(self.path, 'at', encoding='utf-8')
+                header = {'format': ARCHIVE_FORMAT, 'started': time.time(), 'source': self.source}
+                self._file.write(json.dumps(header) + '\n')
+            stamp = time.time() if at is None else at
+            self._file.write(f'{{"t":{stamp:.3f},"events":{line}}}\n')
+            self._file.flush()
+            self._last = line
+            self.written += 1
+            return True
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def get_recorder(path=RECORD_PATH):
+    """Return the process-wide recorder for NFLBOT_RECORD_SCOREBOARD, or None if recording is off."""
+    if not path:
+        return None
+    with _recorders_lock:
+        if path not in _recorders:
+            _recorders[path] = ScoreboardRecorder(path)
+            # The gzip trailer is only written on close
+            atexit.register(_recorders[path].close)
+        return _recorders[path]
+
+
+def read_archive(path):
+    """Return [(unix time, events)] from an archive, oldest first.
+
+    A recorder that was killed leaves its last gzip member unfinished; the
+    complete lines before that point are still returned.
+    """
+    snapshots = []
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        try:
+            for line in f:
+                if not line.endswith('\n'):
+                    break
+                record = json.loads(line)
+                if 'format' in record:
+                    if record['format'] != ARCHIVE_FORMAT:
+                        raise ValueError(f"{path} is a {record['format']} archive, not {ARCHIVE_FORMAT}")
+                    continue
+                snapshots.append((record['t'], record['events']))
+        except EOFError:
+            pass
+    snapshots.sort(key=lambda snapshot: snapshot[0])
+    return snapshots
@@ -0,0 +1,169 @@
+"""Pandas-free schedule store built on the stdlib csv module.
+
+The schedule gist is only a few hundred rows, so plain lists of compact
+`Game` records are plenty. Values are kept exactly as read, which means
+writing the store back out leaves the gist format unchanged.
+"""
+import csv
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from io import StringIO
+
+SCHEDULE_FIELDS = [
+    'Week', 'Date & Time', 'Stadium', 'Home Team', 'Away Team', 'Home Team Short',
+    'Away Team Short', 'Gamecast Link', 'Squabblr Hash ID', 'Status'
+]
+
+# Display columns precomputed by the schedule builder from Date & Time
+DISPLAY_FIELDS = ['Kickoff ET', 'Kickoff Day', 'Kickoff Time', 'Kickoff Epoch']
+
+
+def parse_kickoff(value):
+    """Parse a schedule kickoff into an aware UTC datetime.
+
+    Accepts ESPN's '2023-09-08T00:20Z' as well as the '2023-09-08 00:20:00+00:00'
+    form pandas used to write back to the gist.
+    """
+    if not value:
+        return None
+    text = value.strip()
+    if text.endswith('Z'):
+        text = text[:-1] + '+00:00'
+    kickoff = datetime.fromisoformat(text)
+    if kickoff.tzinfo is None:
+        kickoff = kickoff.replace(tzinfo=timezone.utc)
+    return kickoff.astimezone(timezone.utc)
+
+
+class Game:
+    """One schedule row, read and written by column name like a dict.
+
+    Writes to Status or Date & Time keep the owning store's indexes current.
+    """
+
+    __slots__ = ('_store', '_values', 'position', 'kickoff')
+
+    def __init__(self, store, position, values):
+        self._store = store
+        self._values = values
+        self.position = position
+        self.kickoff = parse_kickoff(values[store._columns['Date & Time']])
+
+    def __getitem__(self, column):
+        return self._values[self._store._columns[column]]
+
+    def __setitem__(self, column, value):
+        position = self._store._columns[column]
+        old = self._values[position]
+        self._values[position] = '' if value is None else str(value)
+        if column == 'Status':
+            self._store._move_status(self, old)
+        elif column == 'Date & Time':
+            self.kickoff = parse_kickoff(self._values[position])
+            self._store._kickoff_index = None
+
+    def get(self, column, default=None):
+        if column not in self._store._columns:
+            return default
+        return self[column]
+
+    def to_dict(self):
+        return dict(zip(self._store.fieldnames, self._values))
+
+    def __repr__(self):
+        return f"<Game {self['Week']}: {self['Away Team']} at {self['Home Team']}>"
+
+
+class ScheduleStore:
+    """All schedule rows, in file order, indexed by kickoff time and status.
+
+    The kickoff index is a sorted list of epoch seconds so time windows are
+    answered by bisection; the status index maps each status to its games.
+    """
+
+    def __init__(self, fieldnames, rows=()):
+        self.fieldnames = list(fieldnames)
+        self._columns = {name: position for position, name in enumerate(self.fieldnames)}
+        self.games = []
+        self._by_status = {}
+        self._kickoff_index = None
+        for row in rows:
+            self.add(row)
+
+    @classmethod
+    def from_csv_text(cls, text):
+        reader = csv.reader(StringIO(text))
+        fieldnames = next(reader, None) or SCHEDULE_FIELDS
+        return cls(fieldnames, reader)
+
+    def add(self, row):
+        """Append a row given as a list of values in column order, or as a dict."""
+        if isinstance(row, dict):
+            values = [row.get(name) or '' for name in self.fieldnames]
+        else:
+            values = list(row) + [''] * (len(self.fieldnames) - len(row))
+        game = Game(self, len(self.games), values)
+        self.games.append(game)
+        self._by_status.setdefault(game['Status'], set()).add(game)
+        self._kickoff_index = None
+        return game
+
+    def ensure_columns(self, names):
+        """Append any missing columns, empty for every existing row."""
+        for name in names:
+            if name not in self._columns:
+                self._columns[name] = len(self.fieldnames)
+                self.fieldnames.append(name)
+                for game in self.games:
+                    game._values.append('')
+
+    def _move_status(self, game, old_status):
+        self._by_status.get(old_status, set()).discard(game)
+        self._by_status.setdefault(game['Status'], set()).add(game)
+
+    def _kickoffs(self):
+        """Return (epochs, games) sorted by kickoff, rebuilding after kickoff changes."""
+        if self._kickoff_index is None:
+            timed = sorted(
+                (game for game in self.games if game.kickoff is not None),
+                key=lambda game: (game.kickoff, game.position)
+            )
+            self._kickoff_index = ([game.kickoff.timestamp() for game in timed], timed)
+        return self._kickoff_index
+
+    def __iter__(self):
+        return iter(self.games)
+
+    def __len__(self):
+        return len(self.games)
+
+    def with_status(self, status):
+        """Return the games with the given status, in file order."""
+        return sorted(self._by_status.get(status, ()), key=lambda game: game.position)
+
+    def kickoff_between(self, start, end, status=None):
+        """Return games kicking off in [start, end], optionally only those with the given status."""
+        epochs, games = self._kickoffs()
+        low = bisect_left(epochs, start.timestamp())
+        high = bisect_right(epochs, end.timestamp())
+        return [game for game in games[low:high] if status is None or game['Status'] == status]
+
+    def next_game_after(self, moment, status=None):
+        """Return the first game to kick off after moment, optionally with the given status, or None."""
+        epochs, games = self._kickoffs()
+        for game in games[bisect_right(epochs, moment.timestamp()):]:
+            if status is None or game['Status'] == status:
+                return game
+        return None
+
+    def to_csv(self):
+        output = StringIO()
+        writer = csv.writer(output, lineterminator='\n')
+        writer.writerow(self.fieldnames)
+        for game in self.games:
+            writer.writerow(game._values)
+        return output.getvalue()
+
+
+def read_schedule(text):
+    return ScheduleStore.from_csv_text(text)
@@ -0,0 +1,110 @@
+"""Build the season schedule from ESPN and merge it into the schedule gist.
+
+Weeks are fetched concurrently, then merged into the existing schedule by
+ESPN game id. Rows keep their Squabblr Hash ID and Status, and only rows
+whose kickoff, venue or teams changed are rewritten.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from nflbot.config import ESPN_CDN
+from nflbot.http_client import get_session
+from nflbot.schedule import DISPLAY_FIELDS, SCHEDULE_FIELDS, ScheduleStore, parse_kickoff
+from nflbot.scoreboard import game_id_from_link
+from nflbot.templates import kickoff_display_fields
+
+ESPN_SCHEDULE_URL = ESPN_CDN + "/core/nfl/schedule?xhr=1&year={year}&week={week}"
+
+# Columns that come from ESPN; everything else in a row belongs to the bot
+ESPN_FIELDS = [
+    'Week', 'Date & Time', 'Stadium', 'Home Team', 'Away Team',
+    'Home Team Short', 'Away Team Short', 'Gamecast Link'
+]
+
+
+def fetch_nfl_schedule_for_week(week_number, year):
+    """Fetch one week of the NFL schedule; the shared client handles timeouts and retries."""
+    response = get_session().get(ESPN_SCHEDULE_URL.format(year=year, week=week_number))
+    response.raise_for_status()
+    data = response.json()
+
+    games = []
+    for date, game_data in data['content']['schedule'].items():
+        for game in game_data['games']:
+            competition = game['competitions'][0]
+            home_team_data = next(team for team in competition['competitors'] if team["homeAway"] == "home")
+            away_team_data = next(team for team in competition['competitors'] if team["homeAway"] == "away")
+
+            games.append({
+                'Week': f"Week {game['week']['number']}",
+                'Date & Time': competition['date'],
+                'Stadium': competition['venue']['fullName'],
+                'Gamecast Link': game['links'][0]['href'],
+                'Home Team': home_team_data["team"]["displayName"],
+                'Away Team': away_team_data["team"]["displayName"],
+                'Home Team Short': home_team_data["team"]["abbreviation"],
+                'Away Team Short': away_team_data["team"]["abbreviation"],
+                'Game ID': str(game['id']),
+            })
+    return games
+
+
+def fetch_season(year, weeks, workers=6):
+    """Fetch every week concurrently and return the games in week order."""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(lambda week: fetch_nfl_schedule_for_week(week, year), weeks)
+        return [game for week_games in results for game in week_games]
+
+
+def _differs(game, fetched, field):
+    if field == 'Date & Time':
+        return game.kickoff != parse_kickoff(fetched[field])
+    return game[field] != fetched[field]
+
+
+def refresh_display_fields(game):
+    """Recompute the game's display columns if its kickoff moved; return True if any changed."""
+    if game.kickoff is None:
+        return False
+    fields = kickoff_display_fields(game.kickoff)
+    stale = [name for name, value in fields.items() if game[name] != value]
+    for name in stale:
+        game[name] = fields[name]
+    return bool(stale)
+
+
+def merge_schedule(schedule, fetched_games):
+    """Merge freshly fetched games into the schedule in place.
+
+    Returns (changed, added). Existing rows only have their ESPN columns
+    rewritten when they differ; new games are appended as scheduled.
+    Display columns are filled in for new rows and recomputed for rows
+    whose kickoff changed.
+    """
+    schedule.ensure_columns(DISPLAY_FIELDS)
+    by_id = {game_id_from_link(game['Gamecast Link']): game for game in schedule}
+    changed = added = 0
+    for fetched in fetched_games:
+        game = by_id.get(fetched['Game ID'])
+        if game is None:
+            row = {field: fetched[field] for field in ESPN_FIELDS}
+            row['Status'] = 'STATUS_SCHEDULED'
+            game = schedule.add(row)
+            refresh_display_fields(game)
+            by_id[fetched['Game ID']] = game
+            added += 1
+            continue
+
+        stale = [field for field in ESPN_FIELDS if _differs(game, fetched, field)]
+        for field in stale:
+            game[field] = fetched[field]
+        if refresh_display_fields(game):
+            stale.append('display columns')
+        if stale:
+            logging.info(f"Updated {', '.join(stale)} for {game['Away Team']} at {game['Home Team']}.")
+            changed += 1
+    return changed, added
+
+
+def empty_schedule():
+    return ScheduleStore(SCHEDULE_FIELDS + DISPLAY_FIELDS)
@@ -0,0 +1,66 @@
+"""Adaptive polling cadence for the resident gamethread scheduler, and when nothing is live at all."""
+import os
+from datetime import timedelta
+
+# Poll intervals in seconds, overridable from the environment
+FAST_POLL = int(os.environ.get('NFLBOT_POLL_FAST', 15))        # last two minutes of the 4th and overtime
+NORMAL_POLL = int(os.environ.get('NFLBOT_POLL_NORMAL', 60))    # any other live game
+SLOW_POLL = int(os.environ.get('NFLBOT_POLL_SLOW', 300))       # halftime
+IDLE_POLL = int(os.environ.get('NFLBOT_POLL_IDLE', 6 * 3600))  # nothing live and nothing coming up
+
+# A game that kicked off longer ago than this is assumed to be over, overtime and delays included
+MAX_GAME_HOURS = float(os.environ.get('NFLBOT_MAX_GAME_HOURS', 6))
+# How far ahead the poster puts up gamethreads, which the updater then edits
+POST_WINDOW_HOURS = 3
+
+LIVE_STATUSES = {'STATUS_IN_PROGRESS', 'STATUS_END_PERIOD', 'STATUS_HALFTIME', 'STATUS_DELAYED'}
+
+
+def clock_seconds(status):
+    """Return the seconds left in the period from an ESPN status block."""
+    if status.get('clock') is not None:
+        return float(status['clock'])
+    minutes, _, seconds = str(status.get('displayClock', '0:00')).partition(':')
+    try:
+        return int(minutes) * 60 + float(seconds or 0)
+    except ValueError:
+        return 0.0
+
+
+def event_poll_delay(event):
+    """Return how soon a single scoreboard event should be polled again, or None if it is not live."""
+    status = event['competitions'][0]['status']
+    name = status['type']['name']
+    if name not in LIVE_STATUSES:
+        return None
+    if name == 'STATUS_HALFTIME':
+        return SLOW_POLL
+    period = status.get('period', 0)
+    if period >= 5 or (period == 4 and clock_seconds(status) <= 120):
+        return FAST_POLL
+    return NORMAL_POLL
+
+
+def live_poll_delay(events):
+    """Return the poll delay for the most urgent live game, or None if no game is live."""
+    delays = [delay for delay in map(event_poll_delay, events) if delay is not None]
+    return min(delays) if delays else None
+
+
+def seconds_until(game, now, lead_seconds=0):
+    """Return the seconds until lead_seconds before the game's kickoff, or None without a game."""
+    if game is None:
+        return None
+    return max((game.kickoff - now).total_seconds() - lead_seconds, 0)
+
+
+def nothing_live(schedule, now, lead_hours=POST_WINDOW_HOURS):
+    """Return True if no game in the schedule can have a gamethread that needs updating.
+
+    A game might if it is marked in progress, or if it is not final yet and
+    kicks off within lead_hours from now or less than MAX_GAME_HOURS ago.
+    """
+    if schedule.with_status('STATUS_IN_PROGRESS'):
+        return False
+    nearby = schedule.kickoff_between(now - timedelta(hours=MAX_GAME_HOURS), now + timedelta(hours=lead_hours))
+    return all(game['Status'] == 'STATUS_FINAL' for game in nearby)
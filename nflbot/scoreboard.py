@@ -0,0 +1,72 @@
+"""One ESPN scoreboard fetch per run, shared by every game lookup."""
+import logging
+import threading
+
+from nflbot.config import ESPN_SITE_API
+from nflbot.espn import parse_scoreboard
+from nflbot.http_client import get_session
+from nflbot.recording import get_recorder
+
+ESPN_SCOREBOARD_URL = f"{ESPN_SITE_API}/apis/site/v2/sports/football/nfl/scoreboard"
+
+
+def game_id_from_link(gamecast_link):
+    """Return the ESPN game id from a gamecast link."""
+    parts = [part for part in str(gamecast_link).split('/') if part]
+    if 'gameId' in parts and parts.index('gameId') + 1 < len(parts):
+        return parts[parts.index('gameId') + 1]
+    return parts[-1]
+
+
+class ScoreboardSnapshot:
+    """Fetch the ESPN scoreboard once and index its events by game id.
+
+    The first lookup downloads the scoreboard; every later lookup in the same
+    run is answered from the index. `fetches_saved` counts the downloads the
+    old per-game fetch would have made on top of the ones actually made.
+    """
+
+    def __init__(self, url=ESPN_SCOREBOARD_URL):
+        self.url = url
+        self.fetches = 0
+        self.lookups = 0
+        self._events = None
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """Download the scoreboard and rebuild the event index."""
+        response = get_session().get(self.url)
+        response.raise_for_status()
+        recorder = get_recorder()
+        if recorder is not None:
+            recorder.record(response.content)
+        # Only the fields the updater reads are kept; news, odds and leaders are dropped while decoding
+        data = parse_scoreboard(response.content)
+        self._events = {event['id']: event for event in data.get('events', [])}
+        self.fetches += 1
+        logging.info(f"Fetched ESPN scoreboard with {len(self._events)} events.")
+
+    def get_event(self, game_id):
+        """Return the scoreboard event for an ESPN game id, or None."""
+        with self._lock:
+            if self._events is None:
+                self.refresh()
+            self.lookups += 1
+            return self._events.get(str(game_id))
+
+    def events(self):
+        """Return every event on the scoreboard, fetching it first if needed."""
+        with self._lock:
+            if self._events is None:
+                self.refresh()
+            return list(self._events.values())
+
+    @property
+    def fetches_saved(self):
+        return max(self.lookups - self.fetches, 0)
+
+    def log_summary(self):
+        logging.info(
+            f"ESPN scoreboard fetched {self.fetches} time(s) for {self.lookups} game lookup(s); "
+            f"saved {self.fetches_saved} fetch(es)."
+        )
@@ -0,0 +1,34 @@
+"""Squabblr posts and edits, sent through the rate-limited dispatcher."""
+import logging
+
+from nflbot.config import SQUABBLR_TOKEN
+from nflbot.dispatcher import get_dispatcher
+from nflbot.fanout import PRIMARY_COMMUNITY
+
+
+def post_to_squabblr(title, content, community=PRIMARY_COMMUNITY):
+    logging.info(f"Posting article '{title}' to /s/{community} on Squabblr.co...")
+    headers = {
+        'authorization': 'Bearer ' + SQUABBLR_TOKEN
+    }
+    response = get_dispatcher().post('new-post', data={
+        "community_name": community,
+        "title": title,
+        "content": content
+    }, headers=headers)
+    response.raise_for_status()
+    logging.info(f"Article '{title}' posted successfully.")
+    return response.json()
+
+
+def update_gamethread_on_squabblr(content, hash_id):
+    headers = {
+        'Authorization': f"Bearer {SQUABBLR_TOKEN}",
+        'Content-Type': 'application/json'
+    }
+    data = {
+        'content': content
+    }
+    response = get_dispatcher().patch(f"posts/{hash_id}", headers=headers, json=data)
+    response.raise_for_status()
+    return response.json()
@@ -0,0 +1,128 @@
+"""Team records indexed by team name, shared by every posting script."""
+import csv
+import logging
+from collections import namedtuple
+from io import StringIO
+
+STANDINGS_HEADERS = ['Conference', 'Division', 'Team', 'Wins', 'Losses', 'Ties', 'Win %']
+
+GameResult = namedtuple('GameResult', ['game_id', 'home', 'away', 'home_score', 'away_score'])
+
+
+class TeamNotFoundError(LookupError):
+    """Raised when a team has no row in the standings."""
+
+
+def format_record(wins, losses, ties):
+    """Return a W-L record, or W-L-T when the team has a tie."""
+    if int(ties) == 0:
+        return f"{wins}-{losses}"
+    return f"{wins}-{losses}-{ties}"
+
+
+def format_win_percent(wins, losses, ties):
+    """Return the win percentage as ESPN shows it, e.g. '.667' or '1.000'; a tie counts as half a win."""
+    played = wins + losses + ties
+    text = f"{(wins + ties / 2) / played if played else 0:.3f}"
+    return text[1:] if text.startswith('0') else text
+
+
+class StandingsIndex:
+    """Preformatted W-L(-T) strings keyed by team for O(1) lookups."""
+
+    def __init__(self, records):
+        self._records = dict(records)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build the index from standings rows with Team, Wins, Losses and Ties columns."""
+        return cls(
+            (row['Team'], format_record(row['Wins'], row['Losses'], row['Ties']))
+            for row in rows
+        )
+
+    def __contains__(self, team):
+        return team in self._records
+
+    def __len__(self):
+        return len(self._records)
+
+    def record(self, team):
+        """Return the team's record string, e.g. '3-1' or '2-1-1'."""
+        try:
+            return self._records[team]
+        except KeyError:
+            raise TeamNotFoundError(f"No standings entry for team {team!r}") from None
+
+
+class StandingsTable:
+    """Full standings rows, in ESPN's order, that final results can be applied to in place."""
+
+    def __init__(self, rows, fieldnames=STANDINGS_HEADERS):
+        self.fieldnames = list(fieldnames)
+        self.rows = [dict(row) for row in rows]
+        self._by_team = {row['Team']: row for row in self.rows}
+
+    @classmethod
+    def from_csv(cls, text):
+        reader = csv.DictReader(StringIO(text or ''))
+        rows = list(reader)
+        return cls(rows, reader.fieldnames or STANDINGS_HEADERS)
+
+    @staticmethod
+    def games_played(row):
+        return int(row['Wins']) + int(row['Losses']) + int(row['Ties'])
+
+    def games(self, team):
+        """Return how many games the team's row counts, or None if the team is missing."""
+        row = self._by_team.get(team)
+        return None if row is None else self.games_played(row)
+
+    def apply(self, result):
+        """Add a final result to both teams' rows; return False if either team is missing."""
+        home, away = self._by_team.get(result.home), self._by_team.get(result.away)
+        if home is None or away is None:
+            logging.warning(f"Cannot apply {result.away} at {result.home}: a team is missing from the standings.")
+            return False
+        if result.home_score == result.away_score:
+            outcomes = ((home, 'Ties'), (away, 'Ties'))
+        elif result.home_score > result.away_score:
+            outcomes = ((home, 'Wins'), (away, 'Losses'))
+        else:
+            outcomes = ((home, 'Losses'), (away, 'Wins'))
+        for row, column in outcomes:
+            row[column] = str(int(row[column]) + 1)
+            row['Win %'] = format_win_percent(int(row['Wins']), int(row['Losses']), int(row['Ties']))
+        return True
+
+    def reconcile(self, espn, pending, limits=None):
+        """Return ESPN's table with the local rows kept for pending teams ESPN has not caught up on.
+
+        limits maps teams to the most games they can have played so far; a
+        local row counting more than that is wrong and gives way to ESPN's.
+        Also returns the teams that are still pending.
+        """
+        limits = limits or {}
+        rows, still_pending = [], set()
+        for row in espn.rows:
+            local = self._by_team.get(row['Team'])
+            if (
+                row['Team'] in pending and local is not None
+                and self.games_played(row) < self.games_played(local) <= limits.get(row['Team'], self.games_played(local))
+            ):
+                rows.append(local)
+                still_pending.add(row['Team'])
+            else:
+                rows.append(row)
+        return StandingsTable(rows, espn.fieldnames), still_pending
+
+    def index(self):
+        return StandingsIndex.from_rows(self.rows)
+
+    def to_csv(self):
+        output = StringIO()
+        writer = csv.writer(output)
+        writer.writerow(self.fieldnames)
+        for row in self.rows:
+            writer.writerow([row[name] for name in self.fieldnames])
+        return output.getvalue()
@@ -0,0 +1,165 @@
+"""Keep the standings gist current as games finish, reconciling with ESPN.
+
+The standings gist carries a small nfl-standings-sync.json next to the CSV.
+It lists the final games already reflected in the CSV, and the teams whose
+rows were updated from a final score but not yet confirmed by ESPN.
+
+When the updater sees a game go final it applies the score to the CSV
+straight away, so posts made before ESPN refreshes already show the new
+records. A score is not applied when both teams' rows already count as
+many games as they have in the schedule up to that kickoff, which happens
+when a standings run copied ESPN's table after ESPN finished the game but
+before the updater did. ESPN is only called when the schedule shows a
+final missing from the list or some teams are still unconfirmed; ESPN's
+rows replace the local ones except where ESPN has fewer games for a team
+than we applied and the schedule says the team has played that many.
+The CSV is only uploaded when it changed. A final with no score to apply
+stays unlisted until ESPN's standings change, or until it kicked off long
+enough ago to be settled, so a game that never moves the standings stops
+triggering refreshes.
+"""
+import csv
+import io
+import json
+import logging
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+
+from nflbot.config import ESPN_CDN, GIST_FILENAME_STANDINGS as STANDINGS_FILENAME
+from nflbot.espn import parse_standings
+from nflbot.gist_journal import fetch_gist_files
+from nflbot.http_client import get_session
+from nflbot.scoreboard import game_id_from_link
+from nflbot.standings import STANDINGS_HEADERS, GameResult, StandingsTable
+
+ESPN_STANDINGS_URL = f"{ESPN_CDN}/core/nfl/standings?xhr=1"
+SYNC_FILENAME = 'nfl-standings-sync.json'
+# A final this long after kickoff is assumed to be in ESPN's standings
+SETTLE_AFTER = timedelta(hours=8)
+
+
+def fetch_nfl_standings(url=ESPN_STANDINGS_URL):
+    response = get_session().get(url)
+    response.raise_for_status()
+    return parse_standings(response.content)
+
+
+def parse_standings_data(standings_data):
+    standings_list = []
+    # Iterate over conferences in the 'groups' key
+    for conference in standings_data['content']['standings']['groups']:
+        # Iterate over divisions in the 'groups' key of each conference
+        for division in conference['groups']:
+            division_name = division['abbreviation']
+            # Iterate over team entries in each division
+            for team_entry in division['standings']['entries']:
+                team_name = team_entry['team']['displayName']
+                # Extract the stats in the expected order: Wins, Losses, Ties, Win %
+                stats = [stat['displayValue'] for stat in team_entry['stats'][:4]]
+                standings_list.append([conference['abbreviation'], division_name, team_name] + stats)
+    return standings_list
+
+
+def create_csv_content(standings_data):
+    csv_output = io.StringIO()
+    csv_writer = csv.writer(csv_output)
+    csv_writer.writerow(STANDINGS_HEADERS)
+    for row in standings_data:
+        csv_writer.writerow(row)
+    return csv_output.getvalue()
+
+
+def final_games(schedule):
+    """Return {ESPN game id: kickoff} for every final game in the schedule."""
+    return {game_id_from_link(game['Gamecast Link']): game.kickoff for game in schedule.with_status('STATUS_FINAL')}
+
+
+def team_kickoffs(schedule):
+    """Return {team: sorted kickoffs of every game the team has in the schedule}."""
+    kickoffs = {}
+    for game in schedule:
+        if game.kickoff is not None:
+            for team in (game['Home Team'], game['Away Team']):
+                kickoffs.setdefault(team, []).append(game.kickoff)
+    for team_games in kickoffs.values():
+        team_games.sort()
+    return kickoffs
+
+
+def already_counted(table, result, kickoffs, kickoff):
+    """Return True if both teams' rows count every game of theirs up to the result's kickoff."""
+    if kickoff is None:
+        return False
+    for team in (result.home, result.away):
+        games = table.games(team)
+        if games is None or team not in kickoffs or games < bisect_right(kickoffs[team], kickoff):
+            return False
+    return True
+
+
+def game_result(game_id, event):
+    """Return the GameResult of a final ESPN scoreboard event, using ESPN's team names."""
+    sides = {
+        competitor['homeAway']: (competitor['team']['displayName'], int(competitor.get('score') or 0))
+        for competitor in event['competitions'][0]['competitors']
+    }
+    (home, home_score), (away, away_score) = sides['home'], sides['away']
+    return GameResult(str(game_id), home, away, home_score, away_score)
+
+
+def sync_standings(journal, gist_id, token, schedule, results=(), force=False):
+    """Apply final results and stage a standings refresh in the journal if anything changed.
+
+    results are GameResults for games that just ended and are final in the
+    schedule. Returns True if a new standings CSV was staged. ESPN is not
+    called when every final is reflected and confirmed, unless force is set.
+    """
+    finals = final_games(schedule)
+    kickoffs = team_kickoffs(schedule)
+    files = fetch_gist_files(gist_id, token)
+    current = files.get(STANDINGS_FILENAME)
+    sync = json.loads(files.get(SYNC_FILENAME) or '{}')
+    synced = set(sync.get('finals', []))
+    pending = set(sync.get('pending', []))
+
+    table = StandingsTable.from_csv(current)
+    for result in results:
+        if result.game_id in synced:
+            continue
+        if already_counted(table, result, kickoffs, finals.get(result.game_id)):
+            logging.info(f"The standings already count {result.away} at {result.home}; not applying it again.")
+            synced.add(result.game_id)
+        elif table.apply(result):
+            logging.info(f"Applied {result.away} {result.away_score}, {result.home} {result.home_score} to the standings.")
+            synced.add(result.game_id)
+            pending.update((result.home, result.away))
+
+    new_finals = set(finals) - synced
+    if new_finals or pending or current is None or force:
+        espn = StandingsTable.from_csv(create_csv_content(parse_standings_data(fetch_nfl_standings())))
+        espn_changed = espn.to_csv() != current
+        now = datetime.now(timezone.utc)
+        limits = {team: bisect_right(team_games, now) for team, team_games in kickoffs.items()}
+        table, pending = table.reconcile(espn, pending, limits)
+        if espn_changed:
+            settled = new_finals
+        else:
+            cutoff = now - SETTLE_AFTER
+            settled = {game_id for game_id in new_finals if finals[game_id] is not None and finals[game_id] < cutoff}
+        synced |= settled
+        if new_finals - settled:
+            logging.info(f"ESPN standings do not reflect {len(new_finals - settled)} new final(s) yet; will retry on the next refresh.")
+        if pending:
+            logging.info(f"Keeping applied results for {len(pending)} team(s) until ESPN catches up.")
+    else:
+        logging.info("No game has finished since the last standings refresh; not calling ESPN.")
+
+    content = table.to_csv()
+    changed = content != current
+    if changed:
+        logging.info("Staging the updated standings CSV.")
+        journal.write(gist_id, STANDINGS_FILENAME, content)
+    marker = json.dumps({'finals': sorted(synced), 'pending': sorted(pending)}, indent=2)
+    if marker != files.get(SYNC_FILENAME):
+        journal.write(gist_id, SYNC_FILENAME, marker)
+    return changed
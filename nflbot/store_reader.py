@@ -0,0 +1,44 @@
+"""Read-only access to the local store's schedule for checks that must start fast.
+
+`nflbot update` decides whether anything is live before loading the rest of
+the bot, so this module only needs sqlite3 and the schedule parser. The
+store itself is written by nflbot.local_store.
+"""
+import json
+import os
+import sqlite3
+import time
+
+from nflbot.config import CACHE_DIR
+from nflbot.schedule import ScheduleStore
+
+DB_PATH = os.environ.get('NFLBOT_DB_PATH', os.path.join(CACHE_DIR, 'nflbot.sqlite3'))
+
+
+def schedule_from_rows(fieldnames, rows):
+    """Return stored schedule rows as a ScheduleStore, keeping columns the gist does not have yet."""
+    fieldnames = list(fieldnames)
+    # Columns added locally, like Community Hash IDs, are kept even before the gist has them
+    for row in rows:
+        fieldnames.extend(name for name in row if name not in fieldnames)
+    return ScheduleStore(fieldnames, rows)
+
+
+def cached_schedule(url, max_age, path=DB_PATH):
+    """Return the stored schedule if it was pulled from url within max_age seconds, else None."""
+    if not os.path.exists(path):
+        return None
+    db = sqlite3.connect(path, timeout=30)
+    try:
+        meta = dict(db.execute(
+            'SELECT key, value FROM meta WHERE key IN (?, ?)', (f"pulled_at:{url}", 'schedule_fields')
+        ))
+        pulled_at = meta.get(f"pulled_at:{url}")
+        if pulled_at is None or time.time() - json.loads(pulled_at) > max_age:
+            return None
+        rows = [json.loads(row) for (row,) in db.execute('SELECT row FROM games ORDER BY position')]
+    except sqlite3.Error:
+        return None
+    finally:
+        db.close()
+    return schedule_from_rows(json.loads(meta.get('schedule_fields', '[]')), rows)
@@ -0,0 +1,157 @@
+"""Gamethread templates shared by the poster and the updater.
+
+A game's static parts (title, Game Details block, team abbreviations) are
+rendered once and cached per game. Each update only fills in the
+scoreboard table and the clock.
+"""
+import threading
+
+import pytz
+
+EASTERN = pytz.timezone('US/Eastern')
+
+SCOREBOARD_TEMPLATE = """**Game Clock**: {clock}
+
+| Team | 1Q | 2Q | 3Q | 4Q | OT | Total |
+|---|---|---|---|---|---|---|
+| **{home_short}** | {home_q1} | {home_q2} | {home_q3} | {home_q4} | {home_ot} | {home_score} |
+| **{away_short}** | {away_q1} | {away_q2} | {away_q3} | {away_q4} | {away_ot} | {away_score} |
+"""
+
+DETAILS_TEMPLATE = """##### Game Details
+- **Kickoff**: {kickoff}
+- **Location**: {stadium}
+- [ESPN Gamecast]({gamecast_link})
+- Home: **{home_team}** ({home_record})
+- Away: **{away_team}** ({away_record})"""
+
+BODY_TEMPLATE = """
+{scoreboard}
+{footer}
+
+-----
+
+##### Join The Live Chat! https://squabblr.co/s/nfl/chat
+
+-----
+
+{details}
+
+-----
+
+I am a bot. Post your feedback to /s/ModBot
+"""
+
+UPDATE_NOTICE = "*Scoreboard will be updated periodically.*"
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def ordinal(number):
+    """Return the ordinal representation of a number."""
+    if 10 <= number % 100 <= 20:
+        suffix = 'th'
+    else:
+        suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(number % 10, 'th')
+    return f"{number}{suffix}"
+
+
+def format_kickoff_datetime(dt):
+    """Format a UTC kickoff datetime as e.g. 'September 10th, 2023 at 01:00PM ET'."""
+    dt_eastern = dt.astimezone(EASTERN)
+    date_part = f"{dt_eastern.strftime('%B')} {ordinal(dt_eastern.day)}, {dt_eastern.year}"
+    time_part = dt_eastern.strftime('%I:%M%p ET')
+    return f"{date_part} at {time_part}"
+
+
+def format_eastern_time(dt):
+    return dt.astimezone(EASTERN).strftime('%I:%M%p ET')
+
+
+def kickoff_display_fields(kickoff):
+    """Return the precomputed display columns for a UTC kickoff."""
+    kickoff_eastern = kickoff.astimezone(EASTERN)
+    return {
+        'Kickoff ET': format_kickoff_datetime(kickoff),
+        'Kickoff Day': kickoff_eastern.strftime('%a %m/%d'),
+        'Kickoff Time': kickoff_eastern.strftime('%I:%M%p ET'),
+        'Kickoff Epoch': str(int(kickoff.timestamp())),
+    }
+
+
+def kickoff_labels(game):
+    """Return the game's display columns, recomputing them if missing or stale.
+
+    The stored epoch doubles as a check: if it no longer matches Date & Time,
+    the kickoff moved after the labels were written.
+    """
+    if game.get('Kickoff Epoch') == str(int(game.kickoff.timestamp())) and game.get('Kickoff ET'):
+        return {name: game[name] for name in ('Kickoff ET', 'Kickoff Day', 'Kickoff Time', 'Kickoff Epoch')}
+    return kickoff_display_fields(game.kickoff)
+
+
+class GameTemplate:
+    """The parts of one game's thread that do not change while it is played."""
+
+    __slots__ = ('title', 'details', 'home_short', 'away_short', 'gamecast_link')
+
+    def __init__(self, game, home_record, away_record, swapped=False):
+        home, away = ('Away', 'Home') if swapped else ('Home', 'Away')
+        self.title = f"[Gamethread] {game['Home Team']} at {game['Away Team']} - {game['Week']}"
+        self.home_short = game[f'{home} Team Short']
+        self.away_short = game[f'{away} Team Short']
+        self.gamecast_link = game['Gamecast Link']
+        self.details = DETAILS_TEMPLATE.format(
+            kickoff=kickoff_labels(game)['Kickoff ET'],
+            stadium=game['Stadium'],
+            gamecast_link=self.gamecast_link,
+            home_team=game[f'{home} Team'],
+            home_record=home_record,
+            away_team=game[f'{away} Team'],
+            away_record=away_record,
+        )
+
+    def render_scoreboard(self, clock, home_linescores=None, away_linescores=None, home_score=0, away_score=0):
+        """Render the clock and score table; missing quarters show as 0."""
+        home_linescores = home_linescores or {}
+        away_linescores = away_linescores or {}
+        return SCOREBOARD_TEMPLATE.format(
+            clock=clock,
+            home_short=self.home_short,
+            away_short=self.away_short,
+            home_score=home_score,
+            away_score=away_score,
+            **{f'home_q{quarter}': home_linescores.get(quarter, '0') for quarter in range(1, 5)},
+            **{f'away_q{quarter}': away_linescores.get(quarter, '0') for quarter in range(1, 5)},
+            home_ot=home_linescores.get(5, '0'),
+            away_ot=away_linescores.get(5, '0'),
+        )
+
+    def render(self, scoreboard_section, updated_at=None):
+        """Put a rendered scoreboard section into the full thread body."""
+        footer = UPDATE_NOTICE if updated_at is None else f"{UPDATE_NOTICE} Last Update: {updated_at}"
+        return BODY_TEMPLATE.format(scoreboard=scoreboard_section, footer=footer, details=self.details)
+
+
+def get_template(game, standings, swapped=False):
+    """Return the cached template for a game, rebuilding it if the game or the records changed.
+
+    With swapped=True the game's home and away teams are exchanged, for when
+    ESPN lists them the other way round from the schedule.
+    """
+    home_team, away_team = game['Home Team'], game['Away Team']
+    if swapped:
+        home_team, away_team = away_team, home_team
+    home_record = standings.record(home_team)
+    away_record = standings.record(away_team)
+
+    key = (game['Gamecast Link'], swapped)
+    fingerprint = (game['Date & Time'], game['Stadium'], game['Week'], home_record, away_record)
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        template = GameTemplate(game, home_record, away_record, swapped)
+        _cache[key] = (fingerprint, template)
+        return template
@@ -0,0 +1,69 @@
+"""Weekly schedule tables, rendered for the whole season at once and cached by data version.
+
+Every week's table comes out of one pass over the schedule: kickoff labels
+are the Eastern Time columns the schedule builder precomputed, and team
+records are joined from the standings index. The tables are kept in the
+local store under the versions (ETags) of the schedule and standings gists
+they were built from, so a repost, a preview or the next week's post reads
+them back until either gist changes.
+"""
+import logging
+
+from nflbot.metrics import get_metrics
+from nflbot.standings import TeamNotFoundError
+from nflbot.templates import kickoff_labels
+
+TABLE_HEADER = "| Date | Time | Matchup |\n|---|---|---|\n"
+
+
+def table_row(game, standings):
+    labels = kickoff_labels(game)
+    return (
+        f"| {labels['Kickoff Day']} | {labels['Kickoff Time']} | "
+        f"{game['Away Team Short']} ({standings.record(game['Away Team'])}) vs. "
+        f"{game['Home Team Short']} ({standings.record(game['Home Team'])}) |"
+    )
+
+
+def build_week_table(games, standings):
+    return TABLE_HEADER + "\n".join(table_row(game, standings) for game in games)
+
+
+def build_week_tables(schedule, standings):
+    """Return {week: table} for every week whose teams all have standings, in one pass."""
+    games_by_week = {}
+    for game in schedule:
+        games_by_week.setdefault(game['Week'], []).append(game)
+    tables = {}
+    for week, games in games_by_week.items():
+        try:
+            tables[week] = build_week_table(games, standings)
+        except TeamNotFoundError as e:
+            # Playoff weeks list teams that are not decided yet; they are rendered on demand
+            logging.debug(f"Not rendering {week} ahead of time: {e}")
+    return tables
+
+
+def week_table(week, schedule, standings, store, versions):
+    """Return the week's table, from the store's cache if it was built from the same versions.
+
+    versions identifies the schedule and standings the caller loaded; when
+    either is unknown nothing is cached. On a miss every week is rendered and
+    cached together. Raises ValueError if the schedule has no games in week.
+    """
+    cacheable = all(versions)
+    if cacheable:
+        content = store.cached_week_table(week, versions)
+        if content is not None:
+            get_metrics().count('week_table_cache_hits')
+            return content
+    tables = build_week_tables(schedule, standings)
+    if cacheable:
+        store.save_week_tables(tables, versions)
+    if week not in tables:
+        games = [game for game in schedule if game['Week'] == week]
+        if not games:
+            raise ValueError(f"No games in {week}")
+        # Raises the same TeamNotFoundError the one-pass build skipped
+        return build_week_table(games, standings)
+    return tables[week]
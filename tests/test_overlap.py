@@ -0,0 +1,91 @@
+"""Check that a poster run landing in the middle of an updater run keeps its posts.
+
+    python -m pytest tests
+    python tests/test_overlap.py
+
+The poster and updater crons both fire on the hour, so their runs overlap.
+Against the fakes in bench/fake_servers.py, game A is in progress and goes
+final while game B is about to kick off. A poster process, with its own
+local store as on a separate runner, posts game B while the updater is
+refreshing game A. Once the updater has written its status changes back,
+the schedule gist must still have game B's hash ID and in-progress status;
+otherwise the next poster run would post a duplicate thread.
+
+nflbot reads its configuration at import time, so under pytest the check
+runs in a fresh interpreter.
+"""
+import csv
+import io
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [REPO_ROOT, os.path.join(REPO_ROOT, 'bench')]
+
+from fake_servers import (  # noqa: E402
+    GAME_SECONDS, SCHEDULES_GIST, STANDINGS_GIST, FakeBackend, ScriptedSlate, configure_env,
+)
+
+
+def schedule_rows(content):
+    return {row['Gamecast Link']: row for row in csv.DictReader(io.StringIO(content))}
+
+
+def check_poster_survives_updater():
+    now = datetime.now(timezone.utc)
+    slate = ScriptedSlate(games=2, kickoff=now - timedelta(hours=3))
+    game_a, game_b = slate.games
+    game_a.elapsed = GAME_SECONDS
+    game_b.kickoff = now + timedelta(minutes=30)
+
+    rows = schedule_rows(slate.schedule_csv())
+    rows[game_a.gamecast_link].update({'Squabblr Hash ID': 'fake00000', 'Status': 'STATUS_IN_PROGRESS'})
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=list(next(iter(rows.values()))), lineterminator='\n')
+    writer.writeheader()
+    writer.writerows(rows.values())
+    gists = {
+        SCHEDULES_GIST: {'nfl-schedule.csv': out.getvalue()},
+        STANDINGS_GIST: {'nfl-standings.csv': slate.standings_csv()},
+    }
+
+    with FakeBackend(slate, gists) as backend, tempfile.TemporaryDirectory() as cache_dir:
+        backend.posts['fake00000'] = ''
+        configure_env(backend, os.path.join(cache_dir, 'updater'))
+        logging.basicConfig(level=logging.WARNING)
+        from nflbot.commands import update as updater
+
+        update_game = updater.update_game
+
+        def update_game_while_posting(game, *args):
+            # The poster runs start to finish while the updater is between its reads and its write
+            poster = subprocess.run(
+                [sys.executable, '-m', 'nflbot', 'post', '--hours', '1'], cwd=REPO_ROOT, capture_output=True,
+                text=True, env={**os.environ, 'NFLBOT_CACHE_DIR': os.path.join(cache_dir, 'poster')},
+            )
+            assert poster.returncode == 0, f"The poster exited with status {poster.returncode}:\n{poster.stderr}"
+            return update_game(game, *args)
+
+        updater.update_game = update_game_while_posting
+        updater.main()
+
+        rows = schedule_rows(backend.gists[SCHEDULES_GIST]['nfl-schedule.csv'])
+
+    a, b = rows[game_a.gamecast_link], rows[game_b.gamecast_link]
+    assert a['Status'] == 'STATUS_FINAL', f"game A was not marked final: {a['Status']}"
+    assert (b['Squabblr Hash ID'], b['Status']) == ('fake00001', 'STATUS_IN_PROGRESS'), (
+        f"the updater undid the poster's changes to game B: {b['Squabblr Hash ID']!r}, {b['Status']}"
+    )
+
+
+def test_poster_survives_updater():
+    check = subprocess.run([sys.executable, os.path.abspath(__file__)], capture_output=True, text=True)
+    assert check.returncode == 0, check.stderr
+
+
+if __name__ == '__main__':
+    check_poster_survives_updater()
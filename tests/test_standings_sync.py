@@ -0,0 +1,196 @@
+"""Tests for applying final scores to the standings gist and reconciling with ESPN.
+
+    python -m pytest tests
+"""
+import csv
+import io
+import json
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nflbot import standings_sync  # noqa: E402
+from nflbot.schedule import read_schedule  # noqa: E402
+from nflbot.standings import STANDINGS_HEADERS, GameResult, StandingsTable, format_win_percent  # noqa: E402
+
+GIST = 'standings-gist'
+BILLS, JETS = 'Buffalo Bills', 'New York Jets'
+RESULT = GameResult('401', BILLS, JETS, 24, 10)
+
+
+class RecordingJournal:
+    """Stands in for GistJournal, keeping what was staged per file."""
+
+    def __init__(self):
+        self.files = {}
+
+    def write(self, gist_id, filename, content):
+        self.files[filename] = content
+
+
+def schedule_csv(kickoff, status='STATUS_FINAL'):
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator='\n')
+    writer.writerow([
+        'Week', 'Date & Time', 'Stadium', 'Home Team', 'Away Team', 'Home Team Short', 'Away Team Short',
+        'Gamecast Link', 'Squabblr Hash ID', 'Status',
+    ])
+    writer.writerow([
+        'Week 1', kickoff.strftime('%Y-%m-%dT%H:%MZ'), 'Highmark Stadium', BILLS, JETS, 'BUF', 'NYJ',
+        'https://www.espn.com/nfl/game/_/gameId/401', 'abc123', status,
+    ])
+    return out.getvalue()
+
+
+def standings_csv(records):
+    """Return the standings CSV for {team: (wins, losses, ties)}, as the standings run writes it."""
+    rows = [
+        ['AFC', 'East', team, str(wins), str(losses), str(ties), format_win_percent(wins, losses, ties)]
+        for team, (wins, losses, ties) in records.items()
+    ]
+    return standings_sync.create_csv_content(rows)
+
+
+def espn_standings(records):
+    """Return {team: (wins, losses, ties)} in the shape of ESPN's standings response."""
+    entries = [{
+        'team': {'displayName': team},
+        'stats': [{'displayValue': value} for value in
+                  (str(wins), str(losses), str(ties), format_win_percent(wins, losses, ties))],
+    } for team, (wins, losses, ties) in records.items()]
+    return {'content': {'standings': {'groups': [
+        {'abbreviation': 'AFC', 'groups': [{'abbreviation': 'East', 'standings': {'entries': entries}}]},
+    ]}}}
+
+
+def sync(monkeypatch, files, espn_records, kickoff, results=()):
+    """Run sync_standings against the given gist files; return (changed, journal, ESPN calls)."""
+    calls = []
+    monkeypatch.setattr(standings_sync, 'fetch_gist_files', lambda gist_id, token: dict(files))
+    monkeypatch.setattr(standings_sync, 'fetch_nfl_standings', lambda: calls.append(1) or espn_standings(espn_records))
+    journal = RecordingJournal()
+    changed = standings_sync.sync_standings(journal, GIST, 'token', read_schedule(schedule_csv(kickoff)), results)
+    return changed, journal, len(calls)
+
+
+def row(content, team):
+    return next(row for row in csv.DictReader(io.StringIO(content)) if row['Team'] == team)
+
+
+def marker(journal):
+    return json.loads(journal.files[standings_sync.SYNC_FILENAME])
+
+
+def test_apply_counts_a_tie_for_both_teams():
+    table = StandingsTable.from_csv(standings_csv({BILLS: (1, 0, 0), JETS: (0, 1, 0)}))
+    assert table.apply(GameResult('402', BILLS, JETS, 20, 20))
+    assert row(table.to_csv(), BILLS)['Ties'] == '1'
+    assert row(table.to_csv(), BILLS)['Win %'] == '.750'
+    assert row(table.to_csv(), JETS)['Win %'] == '.250'
+
+
+def test_apply_skips_a_team_missing_from_the_standings():
+    table = StandingsTable.from_csv(standings_csv({BILLS: (0, 0, 0)}))
+    assert not table.apply(RESULT)
+    assert table.games(BILLS) == 0
+
+
+def test_reconcile_keeps_local_rows_until_espn_catches_up():
+    local = StandingsTable.from_csv(standings_csv({BILLS: (1, 0, 0), JETS: (0, 1, 0)}))
+    behind = StandingsTable.from_csv(standings_csv({BILLS: (0, 0, 0), JETS: (0, 0, 0)}))
+    table, pending = local.reconcile(behind, {BILLS, JETS}, {BILLS: 1, JETS: 1})
+    assert (table.games(BILLS), pending) == (1, {BILLS, JETS})
+
+    caught_up = StandingsTable.from_csv(standings_csv({BILLS: (1, 0, 0), JETS: (0, 1, 0)}))
+    table, pending = local.reconcile(caught_up, {BILLS, JETS}, {BILLS: 1, JETS: 1})
+    assert (table.games(BILLS), pending) == (1, set())
+
+
+def test_reconcile_drops_local_rows_with_more_games_than_were_played():
+    local = StandingsTable.from_csv(standings_csv({BILLS: (2, 0, 0), JETS: (0, 1, 0)}))
+    espn = StandingsTable.from_csv(standings_csv({BILLS: (0, 0, 0), JETS: (0, 0, 0)}))
+    table, pending = local.reconcile(espn, {BILLS, JETS}, {BILLS: 1, JETS: 1})
+    assert (table.games(BILLS), table.games(JETS), pending) == (0, 1, {JETS})
+
+
+def test_final_already_in_the_csv_is_not_applied_again(monkeypatch):
+    kickoff = datetime.now(timezone.utc) - timedelta(hours=3)
+    counted = {BILLS: (1, 0, 0), JETS: (0, 1, 0)}
+    files = {'nfl-standings.csv': standings_csv(counted)}
+
+    changed, journal, espn_calls = sync(monkeypatch, files, counted, kickoff, [RESULT])
+
+    assert not changed
+    assert 'nfl-standings.csv' not in journal.files
+    assert marker(journal) == {'finals': ['401'], 'pending': []}
+    assert espn_calls == 0
+
+
+def test_applied_final_is_kept_until_espn_catches_up(monkeypatch):
+    kickoff = datetime.now(timezone.utc) - timedelta(hours=3)
+    before = {BILLS: (0, 0, 0), JETS: (0, 0, 0)}
+    files = {'nfl-standings.csv': standings_csv(before)}
+
+    changed, journal, espn_calls = sync(monkeypatch, files, before, kickoff, [RESULT])
+
+    assert changed and espn_calls == 1
+    assert row(journal.files['nfl-standings.csv'], BILLS)['Wins'] == '1'
+    assert row(journal.files['nfl-standings.csv'], JETS)['Losses'] == '1'
+    assert marker(journal) == {'finals': ['401'], 'pending': [BILLS, JETS]}
+
+
+def test_unscored_final_stays_unlisted_inside_settle_after(monkeypatch):
+    # A standings run sees the final before ESPN has it, with no score to apply
+    before = {BILLS: (0, 0, 0), JETS: (0, 0, 0)}
+    files = {'nfl-standings.csv': standings_csv(before)}
+
+    recent = datetime.now(timezone.utc) - standings_sync.SETTLE_AFTER + timedelta(hours=1)
+    changed, journal, espn_calls = sync(monkeypatch, files, before, recent)
+    assert not changed and espn_calls == 1
+    assert marker(journal) == {'finals': [], 'pending': []}
+
+    settled = datetime.now(timezone.utc) - standings_sync.SETTLE_AFTER - timedelta(hours=1)
+    changed, journal, espn_calls = sync(monkeypatch, files, before, settled)
+    assert not changed and espn_calls == 1
+    assert marker(journal) == {'finals': ['401'], 'pending': []}
+
+
+def test_tie_is_applied_to_both_teams(monkeypatch):
+    kickoff = datetime.now(timezone.utc) - timedelta(hours=3)
+    before = {BILLS: (0, 0, 0), JETS: (0, 0, 0)}
+    files = {'nfl-standings.csv': standings_csv(before)}
+
+    changed, journal, _ = sync(monkeypatch, files, before, kickoff, [GameResult('401', BILLS, JETS, 17, 17)])
+
+    assert changed
+    for team in (BILLS, JETS):
+        assert row(journal.files['nfl-standings.csv'], team)['Ties'] == '1'
+        assert row(journal.files['nfl-standings.csv'], team)['Win %'] == '.500'
+
+
+def test_rerun_after_a_partial_write_does_not_count_the_final_twice(monkeypatch):
+    kickoff = datetime.now(timezone.utc) - timedelta(hours=3)
+    before = {BILLS: (0, 0, 0), JETS: (0, 0, 0)}
+    changed, journal, _ = sync(monkeypatch, {'nfl-standings.csv': standings_csv(before)}, before, kickoff, [RESULT])
+    assert changed
+
+    # Only the CSV reached the gist; the sync marker was lost, so the rerun sees the same final as new
+    files = {'nfl-standings.csv': journal.files['nfl-standings.csv']}
+    changed, journal, _ = sync(monkeypatch, files, before, kickoff, [RESULT])
+
+    assert not changed
+    assert 'nfl-standings.csv' not in journal.files
+    assert row(files['nfl-standings.csv'], BILLS)['Wins'] == '1'
+    assert marker(journal)['finals'] == ['401']
+
+
+def test_standings_csv_matches_the_checked_in_format():
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'csv', 'nfl_standings.csv')
+    with open(path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0]) == STANDINGS_HEADERS
+    for entry in rows:
+        expected = format_win_percent(int(entry['Wins']), int(entry['Losses']), int(entry['Ties']))
+        assert entry['Win %'] == expected, f"{entry['Team']}: {entry['Win %']!r} != {expected!r}"